@@ -20,6 +20,16 @@ app.conf.update(
     beat_scheduler='celery.beat:PersistentScheduler',
 )
 
+
+@app.on_after_configure.connect
+def setup_periodic_tasks(sender, **kwargs):
+    # Keep upcoming monthly AuditLog partitions provisioned (PostgreSQL only)
+    sender.add_periodic_task(
+        86400.0,  # Daily
+        sender.signature('crm_app.tasks.create_auditlog_partitions'),
+        name='create-auditlog-partitions',
+    )
+
 # Optional: Debug task for testing Celery Beat
 @app.task
 def debug_periodic_task():
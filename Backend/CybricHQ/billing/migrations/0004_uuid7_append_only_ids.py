@@ -0,0 +1,27 @@
+import billing.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('billing', '0003_alter_paymentlog_gateway'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='auditlog',
+            name='id',
+            field=models.UUIDField(default=billing.models.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='paymentlog',
+            name='id',
+            field=models.UUIDField(default=billing.models.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='webhookevent',
+            name='id',
+            field=models.UUIDField(default=billing.models.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+    ]
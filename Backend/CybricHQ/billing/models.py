@@ -4,6 +4,7 @@ Billing models for subscription management, invoices, and payments.
 Security-critical: handles financial data.
 """
 import uuid
+import time
 import hashlib
 import secrets
 from decimal import Decimal
@@ -13,6 +14,18 @@ from django.utils import timezone
 from django.core.validators import MinValueValidator
 
 
+def uuid7():
+    """
+    Time-ordered UUID (RFC 9562 version 7) for append-only tables.
+    48-bit millisecond timestamp followed by random bits, so new primary
+    keys land on the right-most B-tree page instead of a random one.
+    """
+    value = (time.time_ns() // 1_000_000) << 80 | secrets.randbits(80)
+    value = (value & ~(0xF << 76)) | (0x7 << 76)  # version 7
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)  # RFC 4122 variant
+    return uuid.UUID(int=value)
+
+
 class Product(models.Model):
     """
     A product that can be sold (e.g., "CybrikHQ CRM", "IELTS Prep", "Application Portal").
@@ -334,7 +347,7 @@ class PaymentLog(models.Model):
         ('disputed', 'Disputed'),
     ]
     
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     invoice = models.ForeignKey(Invoice, on_delete=models.CASCADE, related_name='payment_logs')
     
     gateway = models.CharField(max_length=20, choices=GATEWAY_CHOICES)
@@ -380,7 +393,7 @@ class AuditLog(models.Model):
         ('reconciliation.completed', 'Reconciliation Completed'),
     ]
     
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     
     # Actor who performed the action (can be null for system actions)
     actor = models.ForeignKey(
@@ -427,7 +440,7 @@ class WebhookEvent(models.Model):
     """
     Store incoming webhook events for idempotency and debugging.
     """
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     
     source = models.CharField(max_length=50, default='stripe')  # 'stripe', 'paypal', etc.
     event_id = models.CharField(max_length=255, unique=True, db_index=True)  # Stripe event ID
@@ -10,13 +10,15 @@ from django.utils import timezone
 from django.db.models import Sum, Count
 from datetime import timedelta
 
+from billing.models import uuid7
+
 
 class UsageLog(models.Model):
     """
     Log of API requests per user.
     Used for rate limiting and usage analytics.
     """
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     user = models.ForeignKey(
         settings.AUTH_USER_MODEL, 
         on_delete=models.CASCADE, 
@@ -55,7 +57,7 @@ class TokenUsage(models.Model):
     """
     Track AI token consumption per user.
     """
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     user = models.ForeignKey(
         settings.AUTH_USER_MODEL, 
         on_delete=models.CASCADE, 
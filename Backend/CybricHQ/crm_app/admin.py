@@ -25,6 +25,7 @@ class ApplicationAdmin(admin.ModelAdmin):
 class CallRecordAdmin(admin.ModelAdmin):
     list_display = ("id","provider","external_call_id","created_at")
     readonly_fields = ("metadata","qualified_data")
+    ordering = ("-created_at",)
 
 @admin.register(Transcript)
 class TranscriptAdmin(admin.ModelAdmin):
@@ -29,13 +29,6 @@ class CrmAppConfig(AppConfig):
     name = "crm_app"
 
     def ready(self):
-        import os
-        
         post_migrate.connect(create_default_groups, sender=self)
         
         import crm_app.signals
-        
-        if os.environ.get('RUN_MAIN') == 'true':
-            from crm_app.services.call_scheduler import start_scheduler
-            start_scheduler()
-            logger.info("AI Call Scheduler started")
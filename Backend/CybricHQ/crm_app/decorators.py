@@ -1,4 +1,6 @@
 # crm_app/decorators.py
+import hmac
+
 from django.conf import settings
 from django.http import HttpResponse
 
@@ -10,7 +12,7 @@ def require_webhook_token(view_func):
     def _wrapped(request, *args, **kwargs):
         token = request.headers.get("X-Webhook-Token") or request.GET.get("token")
         expected = getattr(settings, "ELEVENLABS_WEBHOOK_TOKEN", None)
-        if expected and token != expected:
+        if expected and not hmac.compare_digest((token or "").encode(), expected.encode()):
             return HttpResponse("Invalid webhook token", status=401)
         return view_func(request, *args, **kwargs)
     return _wrapped
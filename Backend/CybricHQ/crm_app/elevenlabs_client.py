@@ -4,10 +4,13 @@ from __future__ import annotations
 import json
 import logging
 import os
+from functools import lru_cache
 from typing import Any, Dict, Optional
 
 import requests
 from django.conf import settings
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +27,20 @@ ELEVEN_DEFAULT_PHONE_ID = getattr(settings, "ELEVENLABS_PHONE_ID", os.environ.ge
 ELEVEN_FOLLOWUP_AGENT_ID = getattr(settings, "ELEVENLABS_FOLLOWUP_AGENT_ID", os.environ.get("ELEVENLABS_FOLLOWUP_AGENT_ID", None))
 
 
+@lru_cache(maxsize=1)
+def http_session() -> requests.Session:
+    """
+    Shared HTTP session for ElevenLabs API calls (conversation fetches, audio
+    downloads, outbound calls) so they reuse pooled keep-alive connections.
+    Throttling and 5xx responses are retried for GETs only; urllib3 never
+    retries the outbound-call POST on a status code.
+    """
+    session = requests.Session()
+    retry = Retry(total=3, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504))
+    session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=50, max_retries=retry))
+    return session
+
+
 def _headers(api_key: Optional[str] = None) -> Dict[str, str]:
     """
     Generate headers for ElevenLabs API requests.
@@ -140,7 +157,7 @@ def create_outbound_call(
 
     try:
         # Use tenant-specific API key if provided
-        resp = requests.post(url, json=payload, headers=_headers(api_key=tenant_api_key), timeout=timeout)
+        resp = http_session().post(url, json=payload, headers=_headers(api_key=tenant_api_key), timeout=timeout)
     except Exception as exc:
         logger.exception("Network error calling ElevenLabs create_outbound_call")
         return {"ok": False, "error": "network_error", "exc": str(exc)}
@@ -0,0 +1,74 @@
+from datetime import date
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.utils import timezone
+
+
+AUDITLOG_TABLE = "crm_app_auditlog"
+
+
+def month_start(year, month):
+    """Normalize (year, month) where month may overflow past 12."""
+    year += (month - 1) // 12
+    month = (month - 1) % 12 + 1
+    return date(year, month, 1)
+
+
+def create_monthly_partitions(cursor, first_month, months):
+    """
+    Create monthly partitions of crm_app_auditlog starting at `first_month`.
+    Existing partitions are left untouched. Returns the names created.
+    """
+    created = []
+    for offset in range(months):
+        start = month_start(first_month.year, first_month.month + offset)
+        end = month_start(start.year, start.month + 1)
+        name = f"{AUDITLOG_TABLE}_y{start.year}m{start.month:02d}"
+        cursor.execute("SELECT to_regclass(%s)", [name])
+        if cursor.fetchone()[0]:
+            continue
+        cursor.execute(
+            f'CREATE TABLE "{name}" PARTITION OF "{AUDITLOG_TABLE}" '
+            f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+        )
+        created.append(name)
+    return created
+
+
+def auditlog_is_partitioned(cursor):
+    cursor.execute(
+        "SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(%s)",
+        [AUDITLOG_TABLE],
+    )
+    return cursor.fetchone() is not None
+
+
+class Command(BaseCommand):
+    help = 'Create upcoming monthly partitions for the AuditLog table (PostgreSQL only)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--months',
+            type=int,
+            default=3,
+            help='Number of months to provision, starting with the current one (default: 3)',
+        )
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'postgresql':
+            self.stdout.write(self.style.WARNING('AuditLog partitioning is only used on PostgreSQL; nothing to do.'))
+            return
+
+        with connection.cursor() as cursor:
+            if not auditlog_is_partitioned(cursor):
+                self.stdout.write(self.style.WARNING(f'{AUDITLOG_TABLE} is not partitioned; run migrations first.'))
+                return
+
+            today = timezone.localdate()
+            created = create_monthly_partitions(cursor, date(today.year, today.month, 1), options['months'])
+
+        if created:
+            self.stdout.write(self.style.SUCCESS(f"Created partitions: {', '.join(created)}"))
+        else:
+            self.stdout.write('All AuditLog partitions already exist')
@@ -0,0 +1,38 @@
+# Expression index backing Lead.objects.by_phone() on PostgreSQL.
+# REGEXP_REPLACE doesn't exist on SQLite, so the index is only built on
+# PostgreSQL; the model state records it either way.
+
+from django.db import migrations, models
+
+
+PHONE_NORM_INDEX = models.Index(models.Func(models.F('phone'), models.Value('\\D'), models.Value(''), models.Value('g'), function='REGEXP_REPLACE'), name='lead_phone_norm_idx')
+
+
+def create_phone_norm_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.add_index(apps.get_model('crm_app', 'Lead'), PHONE_NORM_INDEX)
+
+
+def drop_phone_norm_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.remove_index(apps.get_model('crm_app', 'Lead'), PHONE_NORM_INDEX)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('crm_app', '0024_counselortarget_target_applications_and_more'),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunPython(create_phone_norm_index, drop_phone_norm_index),
+            ],
+            state_operations=[
+                migrations.AddIndex(model_name='lead', index=PHONE_NORM_INDEX),
+            ],
+        ),
+    ]
@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('crm_app', '0025_lead_phone_norm_idx'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='callrecord',
+            name='qualified_data',
+            field=models.JSONField(blank=True, null=True),
+        ),
+    ]
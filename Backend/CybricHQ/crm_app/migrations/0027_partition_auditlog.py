@@ -0,0 +1,136 @@
+# Range-partition crm_app_auditlog by month on created_at (PostgreSQL only).
+# Upcoming partitions are provisioned by `manage.py create_auditlog_partitions`.
+#
+# PostgreSQL requires the partition key in every unique constraint, so the
+# table's primary key becomes (id, created_at). Django keeps treating `id` as
+# the pk; ids stay unique because they all come from one sequence.
+
+import re
+from datetime import date
+
+from django.db import migrations, models
+from django.utils import timezone
+
+
+AUDITLOG_TABLE = "crm_app_auditlog"
+OLD_TABLE = "crm_app_auditlog_unpartitioned"
+
+
+# Partition helpers are kept here rather than imported from the management
+# command so this migration doesn't change if the command does.
+def month_start(year, month):
+    year += (month - 1) // 12
+    month = (month - 1) % 12 + 1
+    return date(year, month, 1)
+
+
+def create_monthly_partitions(cursor, first_month, months):
+    for offset in range(months):
+        start = month_start(first_month.year, first_month.month + offset)
+        end = month_start(start.year, start.month + 1)
+        name = f"{AUDITLOG_TABLE}_y{start.year}m{start.month:02d}"
+        cursor.execute("SELECT to_regclass(%s)", [name])
+        if cursor.fetchone()[0]:
+            continue
+        cursor.execute(
+            f'CREATE TABLE "{name}" PARTITION OF "{AUDITLOG_TABLE}" '
+            f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+        )
+
+
+def auditlog_is_partitioned(cursor):
+    cursor.execute(
+        "SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(%s)",
+        [AUDITLOG_TABLE],
+    )
+    return cursor.fetchone() is not None
+
+
+def foreign_keys(cursor, table):
+    """(name, definition) of each FOREIGN KEY constraint on `table`."""
+    cursor.execute(
+        "SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint "
+        "WHERE conrelid = to_regclass(%s) AND contype = 'f'",
+        [table],
+    )
+    return cursor.fetchall()
+
+
+def secondary_indexes(cursor, table):
+    """CREATE INDEX statements for the non-unique indexes on `table` (FK indexes etc.)."""
+    cursor.execute(
+        "SELECT pg_get_indexdef(indexrelid) FROM pg_index "
+        "WHERE indrelid = to_regclass(%s) AND NOT indisunique",
+        [table],
+    )
+    return [row[0] for row in cursor.fetchall()]
+
+
+def partition_auditlog(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    with schema_editor.connection.cursor() as cursor:
+        if auditlog_is_partitioned(cursor):
+            return
+
+        cursor.execute(f"ALTER TABLE {AUDITLOG_TABLE} RENAME TO {OLD_TABLE}")
+        # LIKE only copies columns and defaults; FKs and indexes are
+        # recreated from the old table once the data is copied.
+        fk_constraints = foreign_keys(cursor, OLD_TABLE)
+        index_defs = secondary_indexes(cursor, OLD_TABLE)
+
+        cursor.execute(
+            f"CREATE TABLE {AUDITLOG_TABLE} "
+            f"(LIKE {OLD_TABLE} INCLUDING DEFAULTS) "
+            "PARTITION BY RANGE (created_at)"
+        )
+
+        # Partitioned tables can't carry the old identity/serial column, so ids
+        # continue from a dedicated sequence.
+        cursor.execute(f"CREATE SEQUENCE {AUDITLOG_TABLE}_partitioned_id_seq OWNED BY {AUDITLOG_TABLE}.id")
+        cursor.execute(
+            f"SELECT setval('{AUDITLOG_TABLE}_partitioned_id_seq', COALESCE(MAX(id), 0) + 1, false) "
+            f"FROM {OLD_TABLE}"
+        )
+        cursor.execute(
+            f"ALTER TABLE {AUDITLOG_TABLE} "
+            f"ALTER COLUMN id SET DEFAULT nextval('{AUDITLOG_TABLE}_partitioned_id_seq')"
+        )
+        cursor.execute(f"ALTER TABLE {AUDITLOG_TABLE} ADD PRIMARY KEY (id, created_at)")
+
+        cursor.execute(f"SELECT MIN(created_at) FROM {OLD_TABLE}")
+        oldest = cursor.fetchone()[0]
+        today = timezone.localdate()
+        first = date(oldest.year, oldest.month, 1) if oldest else date(today.year, today.month, 1)
+        months = (today.year - first.year) * 12 + (today.month - first.month) + 3
+        create_monthly_partitions(cursor, first, months)
+        cursor.execute(f"CREATE TABLE {AUDITLOG_TABLE}_default PARTITION OF {AUDITLOG_TABLE} DEFAULT")
+
+        cursor.execute(f"INSERT INTO {AUDITLOG_TABLE} SELECT * FROM {OLD_TABLE}")
+        cursor.execute(f"DROP TABLE {OLD_TABLE}")
+
+        # Recreated after the drop so they keep their original names.
+        for index_def in index_defs:
+            cursor.execute(re.sub(rf"\bON (ONLY )?(\S+\.)?{OLD_TABLE}\b", f"ON {AUDITLOG_TABLE}", index_def))
+        for name, definition in fk_constraints:
+            cursor.execute(f'ALTER TABLE {AUDITLOG_TABLE} ADD CONSTRAINT "{name}" {definition}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('crm_app', '0026_alter_callrecord_qualified_data'),
+    ]
+
+    operations = [
+        migrations.RunPython(partition_auditlog, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='auditlog',
+            index=models.Index(fields=['target_type', 'target_id'], name='crm_app_aud_target__b9a773_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='auditlog',
+            index=models.Index(fields=['actor'], name='crm_app_aud_actor_12ddf2_idx'),
+        ),
+    ]
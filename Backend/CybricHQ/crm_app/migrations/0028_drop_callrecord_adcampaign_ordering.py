@@ -0,0 +1,19 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('crm_app', '0027_partition_auditlog'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='callrecord',
+            options={},
+        ),
+        migrations.AlterModelOptions(
+            name='adcampaign',
+            options={'verbose_name': 'Ad Campaign', 'verbose_name_plural': 'Ad Campaigns'},
+        ),
+    ]
@@ -0,0 +1,40 @@
+# BRIN indexes on append-only created_at columns (PostgreSQL only).
+# Rows arrive in created_at order, so a block-range index answers date-window
+# queries at a fraction of the size of a B-tree.
+
+from django.db import migrations
+
+
+BRIN_INDEXES = [
+    ('auditlog_created_brin', 'crm_app_auditlog'),
+    ('notification_created_brin', 'crm_app_notification'),
+    ('callrecord_created_brin', 'crm_app_callrecord'),
+]
+
+
+def create_brin_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name, table in BRIN_INDEXES:
+        schema_editor.execute(
+            f"CREATE INDEX IF NOT EXISTS {name} ON {table} "
+            f"USING BRIN (created_at) WITH (pages_per_range = 32);"
+        )
+
+
+def drop_brin_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name, _table in BRIN_INDEXES:
+        schema_editor.execute(f"DROP INDEX IF EXISTS {name};")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('crm_app', '0028_drop_callrecord_adcampaign_ordering'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_brin_indexes, drop_brin_indexes),
+    ]
@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('crm_app', '0029_created_at_brin_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='followup',
+            index=models.Index(condition=models.Q(('channel', 'ai_call'), ('completed', False), ('status', 'scheduled')), fields=['due_at'], name='fu_due_partial_idx'),
+        ),
+    ]
@@ -0,0 +1,27 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('crm_app', '0030_followup_fu_due_partial_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['lead', '-created_at'], name='application_lead_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='academicrecord',
+            index=models.Index(fields=['lead', '-year_of_completion'], name='academic_lead_year_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='callrecord',
+            index=models.Index(fields=['lead', '-created_at'], name='callrecord_lead_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='followup',
+            index=models.Index(fields=['lead', 'completed', 'status'], name='followup_lead_open_idx'),
+        ),
+    ]
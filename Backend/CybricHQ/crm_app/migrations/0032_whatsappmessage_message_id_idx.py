@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('crm_app', '0031_lead_context_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='whatsappmessage',
+            index=models.Index(fields=['message_id'], name='whatsapp_message_id_idx'),
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Expression index backing Lead.objects.by_phone_suffix() on PostgreSQL.
+# REGEXP_REPLACE doesn't exist on SQLite, so the index is only built on
+# PostgreSQL; the model state records it either way.
+
+from django.db import migrations, models
+
+
+PHONE_SUFFIX_INDEX = models.Index(models.Func(models.Func(models.F('phone'), models.Value('\\D'), models.Value(''), models.Value('g'), function='REGEXP_REPLACE'), models.Value(10), function='RIGHT', output_field=models.CharField()), name='lead_phone_suffix_idx')
+
+
+def create_phone_suffix_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.add_index(apps.get_model('crm_app', 'Lead'), PHONE_SUFFIX_INDEX)
+
+
+def drop_phone_suffix_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.remove_index(apps.get_model('crm_app', 'Lead'), PHONE_SUFFIX_INDEX)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('crm_app', '0033_tenant_list_indexes'),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunPython(create_phone_suffix_index, drop_phone_suffix_index),
+            ],
+            state_operations=[
+                migrations.AddIndex(model_name='lead', index=PHONE_SUFFIX_INDEX),
+            ],
+        ),
+    ]
@@ -0,0 +1,19 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('crm_app', '0034_lead_phone_suffix_idx'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='followup',
+            name='fu_due_partial_idx',
+        ),
+        migrations.AddIndex(
+            model_name='followup',
+            index=models.Index(condition=models.Q(('channel__in', ['ai_call', 'phone']), ('completed', False), ('status__in', ['pending', 'scheduled'])), fields=['due_at'], name='fu_due_partial_idx'),
+        ),
+    ]
@@ -0,0 +1,47 @@
+# Rewrite stored Lead.phone values to the form Lead.save() now stores
+# (digits only, keeping a leading '+'), so the exact-match by_phone()
+# fallback on non-PostgreSQL backends also finds leads saved before
+# normalization was added.
+
+import re
+
+from django.db import migrations
+
+
+# Same rule as crm_app.models.normalize_phone, kept here so this migration
+# doesn't change if that helper does.
+PHONE_STRIP_RE = re.compile(r'[^\d+]')
+
+
+def normalize_phone(phone):
+    cleaned = PHONE_STRIP_RE.sub('', phone.strip())
+    if not cleaned:
+        return phone
+    return cleaned[0] + cleaned[1:].replace('+', '')
+
+
+def normalize_lead_phones(apps, schema_editor):
+    Lead = apps.get_model('crm_app', 'Lead')
+    changed = []
+    leads = Lead.objects.exclude(phone__isnull=True).exclude(phone='').only('id', 'phone')
+    for lead in leads.iterator(chunk_size=2000):
+        normalized = normalize_phone(lead.phone)
+        if normalized != lead.phone:
+            lead.phone = normalized
+            changed.append(lead)
+        if len(changed) >= 500:
+            Lead.objects.bulk_update(changed, ['phone'])
+            changed = []
+    if changed:
+        Lead.objects.bulk_update(changed, ['phone'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('crm_app', '0035_followup_due_partial_idx_condition'),
+    ]
+
+    operations = [
+        migrations.RunPython(normalize_lead_phones, migrations.RunPython.noop),
+    ]
@@ -1,8 +1,11 @@
 # crm_app/models.py
 from django.conf import settings
-from django.db import models
+from django.db import models, connections
+from django.db.models import F, Func, Q, Value
 from django.utils import timezone
+from functools import lru_cache
 import os
+import re
 import uuid
 
 
@@ -192,7 +195,6 @@ class TenantUsage(models.Model):
     @classmethod
     def get_or_create_current(cls, tenant):
         """Get or create the usage record for the current month."""
-        from django.utils import timezone
         now = timezone.now()
         usage, _ = cls.objects.get_or_create(
             tenant=tenant,
@@ -205,7 +207,6 @@ class TenantUsage(models.Model):
     @classmethod
     def increment_smartflo_call(cls, tenant, answered=False, duration_seconds=0):
         """Increment SmartFlo call counters for a tenant."""
-        from django.db.models import F
         usage = cls.get_or_create_current(tenant)
         usage.smartflo_calls_made = F('smartflo_calls_made') + 1
         if answered:
@@ -325,6 +326,9 @@ class AcademicRecord(models.Model):
 
     class Meta:
         ordering = ("-created_at",)
+        indexes = [
+            models.Index(fields=['lead', '-year_of_completion'], name='academic_lead_year_idx'),
+        ]
 
     def __str__(self):
         return f"{self.degree} @ {self.institution}" if self.degree and self.institution else f"AcademicRecord {self.id}"
@@ -392,6 +396,10 @@ class Application(models.Model):
 
     class Meta:
         ordering = ("-created_at",)
+        indexes = [
+            models.Index(fields=['lead', '-created_at'], name='application_lead_created_idx'),
+            models.Index(fields=['tenant', '-created_at'], name='application_tenant_created_idx'),
+        ]
 
     def __str__(self):
         return f"Application {self.id} ({self.lead})"
@@ -416,7 +424,7 @@ class CallRecord(models.Model):
     duration_seconds = models.IntegerField(blank=True, null=True)
     metadata = JSONField(blank=True, null=True)
     created_at = models.DateTimeField(default=timezone.now)
-    qualified_data = JSONField(blank=True, null=True, default=dict)  # structured_output from ElevenLabs
+    qualified_data = JSONField(blank=True, null=True)  # structured_output from ElevenLabs
     cost = models.FloatField(blank=True, null=True)
     currency = models.CharField(max_length=8, default="USD")
     
@@ -428,7 +436,12 @@ class CallRecord(models.Model):
     created_at = models.DateTimeField(default=timezone.now)
 
     class Meta:
-        ordering = ("-created_at",)
+        # No ordering: callers that need newest-first order explicitly, so
+        # lookups and aggregates on this table don't pay for a sort.
+        indexes = [
+            models.Index(fields=['lead', '-created_at'], name='callrecord_lead_created_idx'),
+            models.Index(fields=['tenant', '-created_at'], name='callrecord_tenant_created_idx'),
+        ]
 
     def __str__(self):
         return f"CallRecord {self.id} ({self.external_call_id or 'no-ext-id'})"
@@ -464,6 +477,31 @@ class AIResult(models.Model):
         return f"AIResult {self.id} (conf={self.confidence})"
 
 
+class FollowUpQuerySet(models.QuerySet):
+    def due_ai_calls(self, now=None):
+        """
+        AI call follow-ups whose due time has passed.
+        SQL equivalent of FollowUp.is_ai_call_due(), so schedulers don't
+        have to load every row and filter in Python.
+        """
+        return self.filter(
+            channel="ai_call",
+            completed=False,
+            due_at__lte=now or timezone.now(),
+        ).exclude(status__in=FollowUp.CLOSED_STATUSES)
+
+    def claim_for_call(self, pk):
+        """
+        Atomically move an open follow-up to in_progress.
+        The status check and the write happen in one conditional UPDATE, so
+        two triggers racing on the same task can't both start a call.
+        Returns True if this caller claimed the task.
+        """
+        return self.filter(pk=pk, completed=False).exclude(
+            status__in=("completed", "cancelled", "in_progress")
+        ).update(status="in_progress") == 1
+
+
 class FollowUp(models.Model):
     CHANNEL_CHOICES = [
         ("email", "Email"),
@@ -484,6 +522,8 @@ class FollowUp(models.Model):
         ("cancelled", "Cancelled"),
     ]
 
+    CLOSED_STATUSES = ("completed", "failed", "cancelled")
+
     application = models.ForeignKey(Application, on_delete=models.CASCADE, related_name="followups", blank=True, null=True)
     lead = models.ForeignKey('Lead', on_delete=models.CASCADE, blank=True, null=True, related_name="followups")
     
@@ -505,8 +545,27 @@ class FollowUp(models.Model):
     metadata = JSONField(blank=True, null=True)
     created_at = models.DateTimeField(default=timezone.now)
 
+    objects = FollowUpQuerySet.as_manager()
+
     class Meta:
         ordering = ("-created_at",)
+        indexes = [
+            # Only rows the call scanner polls for (tasks.check_and_initiate_followups);
+            # the condition must match that query's filter for the planner to use it
+            models.Index(
+                fields=['due_at'],
+                name='fu_due_partial_idx',
+                condition=Q(
+                    channel__in=['ai_call', 'phone'],
+                    status__in=['pending', 'scheduled'],
+                    completed=False,
+                ),
+            ),
+            # A lead's open tasks (follow-up call context, pending task lists)
+            models.Index(fields=['lead', 'completed', 'status'], name='followup_lead_open_idx'),
+            # Tenant-scoped task list (FollowUpViewSet orders by due_at)
+            models.Index(fields=['tenant', 'due_at'], name='followup_tenant_due_idx'),
+        ]
 
     def __str__(self):
         return f"FollowUp {self.id} ({self.channel})"
@@ -515,11 +574,10 @@ class FollowUp(models.Model):
         """Check if this AI call task is due for execution."""
         if self.channel != "ai_call":
             return False
-        if self.completed or self.status in ["completed", "failed", "cancelled"]:
+        if self.completed or self.status in self.CLOSED_STATUSES:
             return False
         if not self.due_at:
             return False
-        from django.utils import timezone
         return self.due_at <= timezone.now()
 
 
@@ -585,11 +643,95 @@ class AuditLog(models.Model):
         ordering = ("-created_at",)
         verbose_name = "Audit Log"
         verbose_name_plural = "Audit Logs"
+        # On PostgreSQL the table is range-partitioned by month on created_at
+        # (see migration 0027 and the create_auditlog_partitions command), and
+        # its primary key there is (id, created_at); ids are still unique.
+        indexes = [
+            models.Index(fields=['target_type', 'target_id']),
+            models.Index(fields=['actor']),
+        ]
 
     def __str__(self):
         return f"AuditLog {self.id}: {self.action} by {self.actor}"
 
 
+_PHONE_STRIP_RE = re.compile(r'[^\d+]')
+_NON_DIGIT_RE = re.compile(r'\D')
+# National numbers are matched on their last 10 digits, which drops any
+# country code or trunk prefix ("0", "0091", "+91") either side used.
+PHONE_SUFFIX_DIGITS = 10
+
+
+def normalize_phone(phone):
+    """
+    Canonical storage form for phone numbers: digits only, keeping a leading '+'.
+    "+91 98765-43210" -> "+919876543210"
+    """
+    if not phone:
+        return phone
+    cleaned = _PHONE_STRIP_RE.sub('', phone.strip())
+    if not cleaned:
+        return phone
+    return cleaned[0] + cleaned[1:].replace('+', '')
+
+
+def _phone_digits_expression():
+    """SQL digits-only form of Lead.phone (PostgreSQL), as indexed by lead_phone_norm_idx."""
+    return Func(F('phone'), Value(r'\D'), Value(''), Value('g'), function='REGEXP_REPLACE')
+
+
+def _phone_suffix_expression():
+    """Last PHONE_SUFFIX_DIGITS digits of Lead.phone, as indexed by lead_phone_suffix_idx."""
+    return Func(
+        _phone_digits_expression(),
+        Value(PHONE_SUFFIX_DIGITS),
+        function='RIGHT',
+        output_field=models.CharField(),
+    )
+
+
+def phone_digits(phone):
+    """Digits-only form of a phone number, matching the lead_phone_norm_idx expression."""
+    return _NON_DIGIT_RE.sub('', phone or '')
+
+
+class LeadQuerySet(models.QuerySet):
+    def by_phone(self, *phones):
+        """
+        Match leads whose phone equals any of `phones`, ignoring formatting.
+        On PostgreSQL this compares regexp_replace(phone, '\\D', '', 'g') so the
+        lead_phone_norm_idx expression index is used instead of a scan.
+        """
+        digits = {phone_digits(p) for p in phones if p}
+        digits.discard('')
+        if not digits:
+            return self.none()
+
+        if connections[self.db].vendor == 'postgresql':
+            return self.alias(phone_norm=_phone_digits_expression()).filter(phone_norm__in=digits)
+
+        # Other backends (SQLite in dev): stored phones are normalized on save,
+        # so the digit forms with/without '+' cover them.
+        candidates = set(digits) | {f'+{d}' for d in digits} | {p for p in phones if p}
+        return self.filter(phone__in=candidates)
+
+    def by_phone_suffix(self, phone):
+        """
+        Match leads whose phone ends in the same last PHONE_SUFFIX_DIGITS digits
+        as `phone`, whatever prefix or formatting either side was stored with.
+        On PostgreSQL this compares RIGHT(regexp_replace(phone, '\\D', '', 'g'), 10)
+        so the lead_phone_suffix_idx expression index is used.
+        """
+        suffix = phone_digits(phone)[-PHONE_SUFFIX_DIGITS:]
+        if not suffix:
+            return self.none()
+
+        if connections[self.db].vendor == 'postgresql':
+            return self.alias(phone_suffix=_phone_suffix_expression()).filter(phone_suffix=suffix)
+
+        return self.filter(phone__icontains=suffix)
+
+
 class Lead(models.Model):
     LEAD_STATUS_CHOICES = [
         ('new', 'New'),
@@ -739,16 +881,30 @@ class Lead(models.Model):
     created_at = models.DateTimeField(default=timezone.now)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = LeadQuerySet.as_manager()
+
     class Meta:
         ordering = ("-received_at",)
         verbose_name = "Lead"
         verbose_name_plural = "Leads"
+        indexes = [
+            # Tenant-scoped lists (TenantQuerySetMixin) in their display order
+            models.Index(fields=['tenant', '-received_at'], name='lead_tenant_received_idx'),
+            # Expression indexes for by_phone() / by_phone_suffix(). REGEXP_REPLACE is
+            # PostgreSQL-only, so migrations 0025 and 0034 create them only there.
+            models.Index(_phone_digits_expression(), name='lead_phone_norm_idx'),
+            models.Index(_phone_suffix_expression(), name='lead_phone_suffix_idx'),
+        ]
 
     def __str__(self):
         # Use first_name/last_name if available, otherwise use name
         if self.first_name:
             return f"{self.first_name} {self.last_name or ''}".strip()
         return self.name or f"Lead {self.id}"
+
+    def save(self, *args, **kwargs):
+        self.phone = normalize_phone(self.phone)
+        super().save(*args, **kwargs)
     
     def should_skip_ai_automation(self):
         """
@@ -778,6 +934,22 @@ class RoleDashboardPreference(models.Model):
         return f"RoleDashboardPref for {self.role_name}"
 
 
+@lru_cache(maxsize=1024)
+def _role_permission_set(role_id, updated_ts):
+    """
+    Compile a role's permission matrix into a frozenset of "resource:action"
+    strings. Keyed on updated_at, so saving the role invalidates the entry.
+    """
+    permissions = Role.objects.filter(pk=role_id).values_list("permissions", flat=True).first() or {}
+    return frozenset(
+        f"{resource}:{action}"
+        for resource, actions in permissions.items()
+        if isinstance(actions, dict)
+        for action, allowed in actions.items()
+        if allowed
+    )
+
+
 class Role(models.Model):
     """
     Role model for RBAC system.
@@ -802,7 +974,9 @@ class Role(models.Model):
 
     def has_permission(self, resource, action):
         """Check if this role has a specific permission"""
-        return self.permissions.get(resource, {}).get(action, False)
+        if self.pk is None or self.updated_at is None:
+            return bool(self.permissions.get(resource, {}).get(action, False))
+        return f"{resource}:{action}" in _role_permission_set(self.pk, self.updated_at.timestamp())
 
 
 class UserProfile(models.Model):
@@ -944,7 +1118,6 @@ class AdCampaign(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
-        ordering = ("-total_spend",)
         unique_together = ("integration", "external_campaign_id")
         verbose_name = "Ad Campaign"
         verbose_name_plural = "Ad Campaigns"
@@ -1016,6 +1189,10 @@ class WhatsAppMessage(models.Model):
         ordering = ("-created_at",)
         verbose_name = "WhatsApp Message"
         verbose_name_plural = "WhatsApp Messages"
+        indexes = [
+            # Status webhooks look messages up by wamid
+            models.Index(fields=['message_id'], name='whatsapp_message_id_idx'),
+        ]
     
     def __str__(self):
         return f"{self.direction}: {self.to_phone} ({self.status})"
@@ -1138,7 +1315,6 @@ class CounselorTarget(models.Model):
     
     def update_status(self):
         """Update status based on completion and dates"""
-        from django.utils import timezone
         today = timezone.now().date()
         
         if self.is_completed and self.status != 'cancelled':
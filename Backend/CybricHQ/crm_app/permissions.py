@@ -3,9 +3,25 @@ from rest_framework.permissions import BasePermission
 def RolePermission(role_name):
     class _RolePermission(BasePermission):
         def has_permission(self, request, view):
+            # DRF can evaluate the same permission more than once per request;
+            # remember each role's answer on the request.
+            role_perms = getattr(request, '_role_perms', None)
+            if role_perms is None:
+                role_perms = request._role_perms = {}
+            if role_name not in role_perms:
+                role_perms[role_name] = self._check(request)
+            return role_perms[role_name]
+
+        def _check(self, request):
             if not request.user or not request.user.is_authenticated:
                 return False
             if request.user.is_superuser:
                 return True
-            return request.user.groups.filter(name=role_name).exists()
+            # One query for all of the user's groups, shared by every role checked
+            group_names = getattr(request, '_user_group_names', None)
+            if group_names is None:
+                group_names = request._user_group_names = set(
+                    request.user.groups.values_list('name', flat=True)
+                )
+            return role_name in group_names
     return _RolePermission
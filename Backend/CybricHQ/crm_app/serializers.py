@@ -3,6 +3,7 @@ from django.contrib.auth import get_user_model
 from django.db import IntegrityError, transaction
 from rest_framework import serializers
 import logging
+import uuid
 
 from .models import (
     CallRecord,
@@ -18,6 +19,7 @@ from .models import (
     Document,
     Role,
     UserProfile,
+    UserDashboardPreference,
     Notification,
     AdIntegration,
     AdCampaign,
@@ -27,6 +29,18 @@ from .models import (
 User = get_user_model()
 logger = logging.getLogger(__name__)
 
+# Where providers put the customer's number in CallRecord.metadata, in order of preference
+CALL_PHONE_KEYS = ('phone_number', 'phone', 'customer_phone', 'to', 'from')
+NESTED_CALL_PHONE_KEYS = ('phone', 'phone_number', 'to', 'from')
+
+
+def _first_value(data, keys):
+    for key in keys:
+        value = data.get(key)
+        if value:
+            return value
+    return None
+
 
 class UserSerializer(serializers.ModelSerializer):
     role_name = serializers.SerializerMethodField()
@@ -73,8 +87,6 @@ class UserSerializer(serializers.ModelSerializer):
 
         # 2. Merge User Preference (overrides role)
         try:
-            # Avoid circular import
-            from .models import UserDashboardPreference
             pref = UserDashboardPreference.objects.get(user=obj)
             if pref.layout_config and isinstance(pref.layout_config, dict):
                 user_sidebar = pref.layout_config.get("sidebar_config", {})
@@ -333,11 +345,6 @@ class LeadReceiveSerializer(serializers.Serializer):
          - uses transaction.atomic + IntegrityError handling
          - logs unexpected exceptions for easier debugging
         """
-        try:
-            from .models import Lead
-        except Exception:
-            logger.debug("Lead model not available; returning validated_data")
-            return validated_data
 
         # Determine which fields exist on the Lead model to avoid unexpected kwargs
         lead_field_names = {f.name for f in Lead._meta.get_fields() if getattr(f, "editable", True)}
@@ -428,25 +435,14 @@ class CallRecordSerializer(serializers.ModelSerializer):
         # Try to get phone number from metadata - check multiple possible fields
         if obj.metadata and isinstance(obj.metadata, dict):
             # Direct top-level fields
-            phone = (
-                obj.metadata.get('phone_number') or 
-                obj.metadata.get('phone') or 
-                obj.metadata.get('customer_phone') or
-                obj.metadata.get('to') or 
-                obj.metadata.get('from')
-            )
+            phone = _first_value(obj.metadata, CALL_PHONE_KEYS)
             if phone:
                 return phone
             
             # Check nested metadata field
             inner_meta = obj.metadata.get('metadata', {})
             if isinstance(inner_meta, dict):
-                phone = (
-                    inner_meta.get('phone') or 
-                    inner_meta.get('phone_number') or
-                    inner_meta.get('to') or 
-                    inner_meta.get('from')
-                )
+                phone = _first_value(inner_meta, NESTED_CALL_PHONE_KEYS)
                 if phone:
                     return phone
         
@@ -611,7 +607,6 @@ class LeadSerializer(serializers.ModelSerializer):
         value = value.strip()
         
         # Create a mapping of display labels to choice values (case-insensitive)
-        from .models import Lead
         label_to_value = {
             label.lower(): choice_value 
             for choice_value, label in Lead.LEAD_SOURCE_CHOICES
@@ -659,7 +654,6 @@ class LeadSerializer(serializers.ModelSerializer):
 
     def create(self, validated_data):
         if not validated_data.get('external_id'):
-            import uuid
             validated_data['external_id'] = f"lead_{uuid.uuid4().hex[:12]}"
         # Sync name from first_name/last_name if not provided
         if not validated_data.get('name') and validated_data.get('first_name'):
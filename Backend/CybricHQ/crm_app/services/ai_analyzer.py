@@ -3,12 +3,13 @@ AI Call Analyzer Service
 Uses OpenAI GPT-4 to analyze call transcripts and extract insights
 """
 
-from openai import OpenAI
 import os
 import json
 import logging
 from typing import Dict, Optional
 
+from .openai_client import get_openai_client
+
 logger = logging.getLogger(__name__)
 
 
@@ -19,7 +20,7 @@ class CallAnalyzer:
         api_key = os.getenv('OPENAI_API_KEY')
         if not api_key:
             raise ValueError("OPENAI_API_KEY environment variable not set")
-        self.client = OpenAI(api_key=api_key)
+        self.client = get_openai_client(api_key)
         self.model = os.getenv('OPENAI_MODEL', 'gpt-4-turbo-preview')
     
     def analyze_transcript(self, transcript: str, metadata: dict = None, pending_tasks: list = None) -> Dict:
@@ -274,7 +275,7 @@ class DocumentVerifier:
         api_key = os.getenv('OPENAI_API_KEY')
         if not api_key:
             raise ValueError("OPENAI_API_KEY environment variable not set")
-        self.client = OpenAI(api_key=api_key)
+        self.client = get_openai_client(api_key)
     
     def verify_document(self, image_url: str, document_type: str = "passport") -> Dict:
         """
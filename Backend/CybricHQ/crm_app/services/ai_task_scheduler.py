@@ -11,14 +11,12 @@ import logging
 from datetime import datetime, timedelta
 from django.utils import timezone
 
-try:
-    import dateparser
-    DATEPARSER_AVAILABLE = True
-except ImportError:
-    DATEPARSER_AVAILABLE = False
-
 logger = logging.getLogger(__name__)
 
+# dateparser loads its locale data on import; it is only pulled in the first
+# time a note actually needs parsing (see _get_dateparser).
+_dateparser = None
+
 CALL_KEYWORDS = [
     'call', 'phone', 'ring', 'contact', 'speak', 'talk', 'discuss',
     'follow up', 'follow-up', 'followup', 'reach out', 'check in',
@@ -31,12 +29,77 @@ URGENCY_KEYWORDS = {
     'low': ['later', 'sometime', 'when possible', 'eventually', 'next week']
 }
 
+
+def _keyword_words(keywords):
+    """Single-word keywords plus their plain -s/-ing forms ('calls', 'calling')."""
+    return frozenset(
+        form
+        for keyword in keywords if keyword.isalpha()
+        for form in (keyword, keyword + 's', keyword + 'ing')
+    )
+
+
+def _keyword_phrases(keywords):
+    """Multi-word / hyphenated keywords, still matched as substrings."""
+    return tuple(keyword for keyword in keywords if not keyword.isalpha())
+
+
+# Single words are matched against the note's word set, so 'ring' no longer fires
+# on "during" or 'now' on "know"; phrases keep the substring check.
+CALL_WORDS = _keyword_words(CALL_KEYWORDS)
+CALL_PHRASES = _keyword_phrases(CALL_KEYWORDS)
+URGENCY_WORDS = {level: _keyword_words(keywords) for level, keywords in URGENCY_KEYWORDS.items()}
+URGENCY_PHRASES = {level: _keyword_phrases(keywords) for level, keywords in URGENCY_KEYWORDS.items()}
+
+WORD_RE = re.compile(r'[a-z]+')
+
 TIME_PATTERN_KEYWORDS = [
     'at', 'by', 'before', 'after', 'around', 'within', 'in',
     'tomorrow', 'today', 'tonight', 'morning', 'afternoon', 'evening',
     'hour', 'hours', 'minute', 'minutes', 'day', 'days', 'week'
 ]
 
+# All time expressions in one alternation, scanned once per note. More specific
+# forms come first so they win over the bare clock-time pattern at the same spot.
+TIME_RE = re.compile(
+    r'(?P<tomorrow_at>tomorrow\s+(?:at\s+)?\d{1,2}(?::\d{2})?\s*(?:am|pm)?)'
+    r'|(?P<today_at>today\s+(?:at\s+)?\d{1,2}(?::\d{2})?\s*(?:am|pm)?)'
+    r'|(?P<in_n>in\s+\d+\s+(?:hour|minute|day|week)s?)'
+    r'|(?P<within_n>within\s+\d+\s+(?:hour|minute|day|week)s?)'
+    r'|(?P<n_from_now>\d+\s+(?:hour|minute|day|week)s?\s+from\s+now)'
+    r'|(?P<next_weekday>next\s+(?:monday|tuesday|wednesday|thursday|friday|saturday|sunday))'
+    r'|(?P<this_part>this\s+(?:afternoon|morning|evening))'
+    r'|(?P<tomorrow>tomorrow(?:\s+morning|\s+afternoon|\s+evening)?)'
+    r'|(?:call|contact|reach|speak|follow up|schedule)?\s*(?:at|by|around|before)?\s*'
+    r'(?P<clock>\d{1,2}(?::\d{2})?\s*(?:am|pm)?)',
+    re.IGNORECASE,
+)
+
+TIME_KEYWORD_RE = re.compile(
+    r'\b(?:' + '|'.join(re.escape(keyword) for keyword in TIME_PATTERN_KEYWORDS) + r')\b',
+    re.IGNORECASE,
+)
+
+# dateparser settings shared by every parse; RELATIVE_BASE is filled in per call
+DATEPARSER_SETTINGS = {
+    'PREFER_DATES_FROM': 'future',
+    'RETURN_AS_TIMEZONE_AWARE': False,
+}
+# Task notes are written in English; pinning the language skips detection
+DATEPARSER_LANGUAGES = ['en']
+
+
+def _get_dateparser():
+    """Import dateparser on first use; returns None if it isn't installed."""
+    global _dateparser
+    if _dateparser is None:
+        try:
+            import dateparser
+            _dateparser = dateparser
+        except ImportError:
+            _dateparser = False
+    return _dateparser or None
+
 
 class AITaskScheduler:
     """Analyzes tasks and determines scheduling decisions."""
@@ -65,11 +128,13 @@ class AITaskScheduler:
         notes_lower = notes.lower()
         analysis_notes = []
         
-        requires_call = self._detect_call_required(notes_lower)
+        words = set(WORD_RE.findall(notes_lower))
+        
+        requires_call = self._detect_call_required(notes_lower, words)
         if requires_call:
             analysis_notes.append("Detected call-related keywords in task notes")
         
-        urgency = self._detect_urgency(notes_lower)
+        urgency = self._detect_urgency(notes_lower, words)
         analysis_notes.append(f"Urgency level: {urgency}")
         
         parsed_time, time_expression, confidence = self._parse_time_expression(notes)
@@ -108,19 +173,19 @@ class AITaskScheduler:
             'analysis_notes': analysis_notes,
         }
     
-    def _detect_call_required(self, notes_lower: str) -> bool:
+    def _detect_call_required(self, notes_lower: str, words: set) -> bool:
         """Check if the notes indicate a call is required."""
-        for keyword in CALL_KEYWORDS:
-            if keyword in notes_lower:
-                return True
-        return False
+        if not words.isdisjoint(CALL_WORDS):
+            return True
+        return any(phrase in notes_lower for phrase in CALL_PHRASES)
     
-    def _detect_urgency(self, notes_lower: str) -> str:
+    def _detect_urgency(self, notes_lower: str, words: set) -> str:
         """Detect urgency level from notes."""
-        for level, keywords in URGENCY_KEYWORDS.items():
-            for keyword in keywords:
-                if keyword in notes_lower:
-                    return level
+        for level in URGENCY_KEYWORDS:
+            if not words.isdisjoint(URGENCY_WORDS[level]):
+                return level
+            if any(phrase in notes_lower for phrase in URGENCY_PHRASES[level]):
+                return level
         return 'medium'
     
     def _parse_time_expression(self, notes: str):
@@ -129,64 +194,48 @@ class AITaskScheduler:
         
         Returns: (parsed_datetime, matched_expression, confidence)
         """
-        if not DATEPARSER_AVAILABLE:
+        # dateparser is by far the slowest step here, so only call it when the
+        # note actually looks like it mentions a time.
+        candidates = list(TIME_RE.finditer(notes))
+        has_time_keyword = TIME_KEYWORD_RE.search(notes) is not None
+        if not candidates and not has_time_keyword:
+            return None, None, 0.0
+        
+        dateparser = _get_dateparser()
+        if dateparser is None:
             logger.warning("dateparser not available, skipping time parsing")
             return None, None, 0.0
         
-        time_patterns = [
-            r'(?:call|contact|reach|speak|follow up|schedule)?\s*(?:at|by|around|before)?\s*(\d{1,2}(?::\d{2})?\s*(?:am|pm|AM|PM)?)',
-            r'(tomorrow\s+(?:at\s+)?\d{1,2}(?::\d{2})?\s*(?:am|pm)?)',
-            r'(today\s+(?:at\s+)?\d{1,2}(?::\d{2})?\s*(?:am|pm)?)',
-            r'(in\s+\d+\s+(?:hour|minute|day|week)s?)',
-            r'(within\s+\d+\s+(?:hour|minute|day|week)s?)',
-            r'(\d+\s+(?:hour|minute|day|week)s?\s+from\s+now)',
-            r'(next\s+(?:monday|tuesday|wednesday|thursday|friday|saturday|sunday))',
-            r'(this\s+(?:afternoon|morning|evening))',
-            r'(tomorrow(?:\s+morning|\s+afternoon|\s+evening)?)',
-        ]
+        now = timezone.now()
+        parser_settings = {**DATEPARSER_SETTINGS, 'RELATIVE_BASE': now.replace(tzinfo=None)}
         
         best_match = None
         best_parsed = None
         best_confidence = 0.0
         
-        for pattern in time_patterns:
-            matches = re.findall(pattern, notes, re.IGNORECASE)
-            for match in matches:
-                if isinstance(match, tuple):
-                    match = match[0] if match else ''
-                if not match:
-                    continue
-                    
-                parsed = dateparser.parse(
-                    match,
-                    settings={
-                        'PREFER_DATES_FROM': 'future',
-                        'RELATIVE_BASE': timezone.now().replace(tzinfo=None),
-                        'RETURN_AS_TIMEZONE_AWARE': False,
-                    }
-                )
+        for m in candidates:
+            if best_confidence >= 0.9:
+                break
+            match = m.group(m.lastgroup)
+            if not match:
+                continue
                 
-                if parsed:
-                    parsed = timezone.make_aware(parsed) if timezone.is_naive(parsed) else parsed
-                    if parsed > timezone.now():
-                        confidence = 0.9 if ':' in match or 'am' in match.lower() or 'pm' in match.lower() else 0.7
-                        if confidence > best_confidence:
-                            best_match = match.strip()
-                            best_parsed = parsed
-                            best_confidence = confidence
+            parsed = dateparser.parse(match, languages=DATEPARSER_LANGUAGES, settings=parser_settings)
+            
+            if parsed:
+                parsed = timezone.make_aware(parsed) if timezone.is_naive(parsed) else parsed
+                if parsed > now:
+                    confidence = 0.9 if ':' in match or 'am' in match.lower() or 'pm' in match.lower() else 0.7
+                    if confidence > best_confidence:
+                        best_match = match.strip()
+                        best_parsed = parsed
+                        best_confidence = confidence
         
-        if not best_parsed:
-            parsed = dateparser.parse(
-                notes,
-                settings={
-                    'PREFER_DATES_FROM': 'future',
-                    'RELATIVE_BASE': timezone.now().replace(tzinfo=None),
-                    'RETURN_AS_TIMEZONE_AWARE': False,
-                }
-            )
+        if not best_parsed and not candidates and has_time_keyword:
+            parsed = dateparser.parse(notes, languages=DATEPARSER_LANGUAGES, settings=parser_settings)
             if parsed:
                 parsed = timezone.make_aware(parsed) if timezone.is_naive(parsed) else parsed
-                if parsed > timezone.now():
+                if parsed > now:
                     best_parsed = parsed
                     best_match = "inferred from notes"
                     best_confidence = 0.5
@@ -233,7 +282,15 @@ class AITaskScheduler:
         return False, f"Scheduled for {task.due_at}"
 
 
-ai_scheduler = AITaskScheduler()
+_ai_scheduler = None
+
+
+def get_ai_scheduler():
+    """Shared AITaskScheduler, created on first use."""
+    global _ai_scheduler
+    if _ai_scheduler is None:
+        _ai_scheduler = AITaskScheduler()
+    return _ai_scheduler
 
 
 def analyze_and_schedule_task(task, notes=None, existing_due_at=None, channel=None):
@@ -253,26 +310,35 @@ def analyze_and_schedule_task(task, notes=None, existing_due_at=None, channel=No
     existing_due_at = existing_due_at or getattr(task, 'due_at', None)
     channel = channel or getattr(task, 'channel', None)
     
-    analysis = ai_scheduler.analyze_task(notes, existing_due_at, channel)
+    analysis = get_ai_scheduler().analyze_task(notes, existing_due_at, channel)
     
     actions_taken = []
+    dirty = set()
     
     if analysis['auto_schedule_at'] and (not task.due_at or task.due_at != analysis['auto_schedule_at']):
         task.due_at = analysis['auto_schedule_at']
+        dirty.add('due_at')
         actions_taken.append(f"Auto-scheduled for {analysis['auto_schedule_at'].strftime('%Y-%m-%d %H:%M')}")
     
     if analysis['requires_call'] and task.channel != 'ai_call':
         task.channel = 'ai_call'
-        task.status = 'scheduled'
+        dirty.add('channel')
+        if task.status != 'scheduled':
+            task.status = 'scheduled'
+            dirty.add('status')
         actions_taken.append("Changed channel to AI call based on notes analysis")
     
     if analysis['requires_call'] or task.channel == 'ai_call':
         if not hasattr(task, 'status') or task.status in [None, 'pending']:
             task.status = 'scheduled'
+            dirty.add('status')
             actions_taken.append("Status set to scheduled")
     
-    if actions_taken:
-        task.save()
+    if dirty:
+        if task.pk:
+            task.save(update_fields=sorted(dirty))
+        else:
+            task.save()
     
     return {
         'analysis': analysis,
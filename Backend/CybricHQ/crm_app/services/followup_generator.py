@@ -7,10 +7,105 @@ so ElevenLabs AI agent knows exactly what to discuss with the student.
 
 import logging
 from datetime import timedelta
+from django.core.cache import cache
+from django.db.models import Count, OuterRef, Prefetch, Subquery
+from django.db.models.fields.json import KT
 from django.utils import timezone
 
+from ..models import AcademicRecord, Application, CallRecord, FollowUp, Lead
+
 logger = logging.getLogger(__name__)
 
+# Rows each context section shows; prefetches stop here and only a full
+# slice needs a separate COUNT.
+APPLICATIONS_SHOWN = 5
+ACADEMIC_RECORDS_SHOWN = 3
+PENDING_TASKS_SHOWN = 5
+
+# Built contexts are reused for a short while; the lead's data signals drop
+# them early (see FollowUpGenerator.invalidate).
+CONTEXT_CACHE_TIMEOUT = 60
+
+# _flatten_for_elevenlabs tables.
+# (output variable, context key, default when the key is missing)
+_SCALAR_FIELDS = (
+    ("name", "student_name", "Student"),
+    ("phone", "phone", ""),
+    ("email", "email", ""),
+    ("highestQualification", "highest_qualification", "Unknown"),
+    ("yearCompletion", "year_completion", ""),
+    ("studentInterestLevel", "overall_interest_level", "unknown"),
+    ("documentStatus", "document_status", "unknown"),
+    ("application_count", "application_count", 0),
+    ("latest_application_status", "latest_application_status", "none"),
+    ("previous_calls_count", "previous_calls_count", 0),
+    ("last_call_date", "last_call_date", "Never"),
+    ("qualification_score", "qualification_score", 0),
+    ("pending_tasks_count", "pending_tasks_count", 0),
+)
+
+# (output variable, context key, key tried when the first is empty, default)
+_FALLBACK_FIELDS = (
+    ("marksHighestQualification", "qualification_marks", "qualification_score", ""),
+    ("ieltsPteStatus", "english_proficiency", "english_test_scores", "Unknown"),
+    ("followUpReason", "call_reason", "followUpReason", "general_followup"),
+    ("callObjective", "call_notes", "callObjective", "Follow up with student"),
+    ("previousCallSummary", "last_call_summary", "previousCallSummary", "No previous calls"),
+    ("callScript", "call_script", "callScript", ""),
+)
+
+# (output variable, list-valued context key, text when the list is empty)
+_JOINED_FIELDS = (
+    ("missingDocuments", "missing_documents", "None identified"),
+    ("target_countries", "target_countries", "Not specified"),
+    ("target_universities", "target_universities", "Not specified"),
+    ("submitted_documents", "submitted_documents", "None yet"),
+    ("special_requirements", "special_requirements", "None"),
+)
+
+# Talking points that don't depend on the lead, by call reason
+_STATIC_TALKING_POINTS = {
+    "document_collection": (
+        "Explain document requirements and deadlines",
+        "Offer assistance with document preparation",
+    ),
+    "enrollment_followup": (
+        "Discuss enrollment decision and any concerns",
+        "Answer questions about university/program",
+        "Confirm next steps in admission process",
+    ),
+}
+# General follow-up points, keyed by the context fact that selects them
+_DOCUMENTS_OUTSTANDING = frozenset(["pending", "partial", "not_started"])
+_APPLICATION_POINT = {
+    True: "Provide update on application status",
+    False: "Discuss study abroad interests and program options",
+}
+_CALL_HISTORY_POINT = {
+    True: "Follow up on previous discussion points",
+    False: "Introduce services and gather student requirements",
+}
+_INTEREST_POINTS = {
+    "high": "Encourage enrollment and offer fast-track support",
+    "low": "Address concerns and re-engage interest",
+}
+
+# (legacy snake_case variable, camelCase variable it mirrors)
+_ALIASED_FIELDS = (
+    ("student_name", "name"),
+    ("call_reason", "followUpReason"),
+    ("call_notes", "callObjective"),
+    ("document_status", "documentStatus"),
+    ("missing_documents", "missingDocuments"),
+    ("highest_qualification", "highestQualification"),
+    ("english_proficiency", "ieltsPteStatus"),
+    ("last_call_summary", "previousCallSummary"),
+    ("overall_interest_level", "studentInterestLevel"),
+    ("previous_discussion_points", "previousDiscussionPoints"),
+    ("preferred_country", "preferredCountry"),
+    ("talking_points", "keyTopics"),
+)
+
 
 class FollowUpGenerator:
     """
@@ -18,12 +113,72 @@ class FollowUpGenerator:
     Collects all relevant student data to pass to ElevenLabs.
     """
     
+    @classmethod
+    def prefetch_for_context(cls, qs):
+        """
+        Prefetch everything generate_call_context reads, so the context
+        builders work on in-memory lists instead of querying per section.
+        `qs` is a Lead queryset. Each relation is capped at the rows, and
+        narrowed to the columns, the context actually uses.
+        """
+        call_count = (
+            CallRecord.objects.filter(lead=OuterRef('pk'))
+            .order_by().values('lead').annotate(n=Count('pk')).values('n')
+        )
+        return qs.annotate(call_count=Subquery(call_count)).prefetch_related(
+            Prefetch(
+                'applications',
+                queryset=Application.objects.only('lead', 'university_name', 'program', 'status', 'intake')
+                .annotate(country=KT('metadata__country'))
+                .order_by('-created_at')[:APPLICATIONS_SHOWN],
+                to_attr='recent_applications',
+            ),
+            Prefetch(
+                'academic_records',
+                queryset=AcademicRecord.objects.only('lead', 'degree', 'institution', 'year_of_completion', 'grade', 'score')
+                .order_by('-year_of_completion')[:ACADEMIC_RECORDS_SHOWN],
+                to_attr='top_academic_records',
+            ),
+            Prefetch(
+                'call_records',
+                queryset=CallRecord.objects.only('lead', 'created_at', 'ai_analysis_result').order_by('-created_at')[:1],
+                to_attr='latest_calls',
+            ),
+            # One extra so the task being enriched can be dropped from the list
+            Prefetch(
+                'followups',
+                queryset=cls._open_followups(FollowUp.objects.only('lead', 'notes', 'due_at', 'channel'))[:PENDING_TASKS_SHOWN + 1],
+                to_attr='open_followups',
+            ),
+        )
+    
+    @staticmethod
+    def _open_followups(qs):
+        return qs.filter(completed=False).exclude(status__in=['completed', 'cancelled'])
+    
+    @staticmethod
+    def _context_cache_key(lead_id):
+        return f"followup_ctx:{lead_id}"
+    
+    @classmethod
+    def invalidate(cls, applicant_id):
+        """Forget cached call contexts for a lead whose data changed."""
+        if applicant_id:
+            cache.delete(cls._context_cache_key(applicant_id))
+    
+    def _ensure_prefetched(self, applicant):
+        """Re-fetch the lead through prefetch_for_context unless the caller already did."""
+        if hasattr(applicant, 'open_followups') or not applicant.pk:
+            return applicant
+        return self.prefetch_for_context(type(applicant).objects.filter(pk=applicant.pk)).first() or applicant
+    
     def generate_call_context(self, applicant, reason=None, notes=None, task=None):
         """
         Generate comprehensive context for an AI call.
         
         Args:
-            applicant: The Applicant model instance
+            applicant: The Lead to call. Pass one loaded through
+                prefetch_for_context() to avoid an extra fetch here.
             reason: Why this call is being made (e.g., "document_collection", "enrollment_followup")
             notes: Additional notes/instructions for the call
             task: Optional FollowUp task that triggered this
@@ -34,6 +189,16 @@ class FollowUpGenerator:
         if not applicant:
             return {"error": "No applicant provided"}
         
+        # One entry per lead holding every (reason, notes, task) variant, so
+        # invalidate() is a single delete.
+        cache_key = self._context_cache_key(applicant.pk) if applicant.pk else None
+        variant = (reason, notes, getattr(task, 'id', None))
+        cached = (cache.get(cache_key) or {}) if cache_key else {}
+        if variant in cached:
+            return dict(cached[variant])
+        
+        applicant = self._ensure_prefetched(applicant)
+        
         context = {
             "student_name": self._get_student_name(applicant),
             "phone": applicant.phone or "",
@@ -52,7 +217,11 @@ class FollowUpGenerator:
         context["talking_points"] = self._generate_talking_points(context, reason)
         
         flattened = self._flatten_for_elevenlabs(context)
-        return flattened
+        if cache_key:
+            cached[variant] = flattened
+            cache.set(cache_key, cached, CONTEXT_CACHE_TIMEOUT)
+        # Callers add their own keys; keep the cached copy pristine
+        return dict(flattened)
     
     def _flatten_for_elevenlabs(self, context):
         """
@@ -65,110 +234,60 @@ class FollowUpGenerator:
                        yearCompletion, ieltsPteStatus, studentInterestLevel
         - Documents: documentStatus, missingDocuments
         - Discussion: keyTopics, previousDiscussionPoints, studentConcerns, callScript
+        
+        The plain mappings live in the module-level _*_FIELDS tables; only the
+        summaries are built by hand.
         """
+        if "error" in context:
+            return {"error": str(context["error"])}
+        
+        get = context.get
         flat = {}
         
-        # === Student Information Variables ===
-        student_name = str(context.get("student_name", "Student"))
-        flat["name"] = student_name
-        flat["student_name"] = student_name
-        flat["phone"] = str(context.get("phone", ""))
-        flat["email"] = str(context.get("email", ""))
-        
-        # Preferred country (camelCase for ElevenLabs)
-        flat["preferredCountry"] = str(context.get("preferred_country", "") or context.get("target_countries", [""])[0] if context.get("target_countries") else "Not specified")
-        
-        # Qualification details
-        flat["highestQualification"] = str(context.get("highest_qualification", "Unknown"))
-        flat["marksHighestQualification"] = str(context.get("qualification_marks", "") or context.get("qualification_score", ""))
-        flat["yearCompletion"] = str(context.get("year_completion", ""))
-        flat["ieltsPteStatus"] = str(context.get("english_proficiency", "") or context.get("english_test_scores", "Unknown"))
-        flat["studentInterestLevel"] = str(context.get("overall_interest_level", "unknown"))
-        
-        # === Call Context Variables ===
-        flat["followUpReason"] = str(context.get("call_reason", "") or context.get("followUpReason", "general_followup"))
-        flat["callObjective"] = str(context.get("call_notes", "") or context.get("callObjective", "Follow up with student"))
-        flat["previousCallSummary"] = str(context.get("last_call_summary", "") or context.get("previousCallSummary", "No previous calls"))
-        
-        # === Documents Status Variables ===
-        flat["documentStatus"] = str(context.get("document_status", "unknown"))
-        flat["missingDocuments"] = ", ".join(context.get("missing_documents", [])) or "None identified"
-        
-        # === Discussion & Conversation Flow Variables ===
-        talking_points = context.get("talking_points", [])
-        flat["keyTopics"] = " | ".join(talking_points) if talking_points else str(context.get("keyTopics", "General follow-up"))
-        
-        if context.get("previous_discussion_points"):
-            flat["previousDiscussionPoints"] = "; ".join(context["previous_discussion_points"][:5])
-        else:
-            flat["previousDiscussionPoints"] = "None"
+        for out, key, default in _SCALAR_FIELDS:
+            flat[out] = str(get(key, default))
+        for out, key, fallback, default in _FALLBACK_FIELDS:
+            flat[out] = str(get(key, "") or get(fallback, default))
+        for out, key, empty in _JOINED_FIELDS:
+            flat[out] = ", ".join(get(key, [])) or empty
         
-        concerns = context.get("concerns", []) or context.get("student_concerns", [])
-        flat["studentConcerns"] = " | ".join(concerns) if concerns else "None raised"
+        target_countries = get("target_countries")
+        flat["preferredCountry"] = str(get("preferred_country", "") or target_countries[0]) if target_countries else "Not specified"
         
-        flat["callScript"] = str(context.get("call_script", "") or context.get("callScript", ""))
+        talking_points = get("talking_points")
+        flat["keyTopics"] = " | ".join(talking_points) if talking_points else str(get("keyTopics", "General follow-up"))
         
-        # === Legacy/Additional Variables (backwards compatibility) ===
-        flat["call_reason"] = flat["followUpReason"]
-        flat["call_notes"] = flat["callObjective"]
-        
-        flat["has_applications"] = "yes" if context.get("has_applications") else "no"
-        flat["application_count"] = str(context.get("application_count", 0))
-        
-        apps = context.get("applications", [])
-        if apps:
-            app_summary = "; ".join([
-                f"{a.get('university', 'Unknown')} - {a.get('program', 'Unknown')} ({a.get('status', 'pending')})"
-                for a in apps[:3]
-            ])
-            flat["applications_summary"] = app_summary
-        else:
-            flat["applications_summary"] = "No applications yet"
-        
-        flat["target_countries"] = ", ".join(context.get("target_countries", [])) or "Not specified"
-        flat["target_universities"] = ", ".join(context.get("target_universities", [])) or "Not specified"
-        flat["latest_application_status"] = str(context.get("latest_application_status", "none"))
-        
-        flat["document_status"] = flat["documentStatus"]
-        flat["missing_documents"] = flat["missingDocuments"]
-        flat["submitted_documents"] = ", ".join(context.get("submitted_documents", [])) or "None yet"
-        
-        records = context.get("academic_records", [])
-        if records:
-            academic_summary = "; ".join([
-                f"{r.get('degree', '')} from {r.get('institution', 'Unknown')} ({r.get('year', '')})"
-                for r in records[:2]
-            ])
-            flat["academic_summary"] = academic_summary
-        else:
-            flat["academic_summary"] = "No academic records"
+        discussion_points = get("previous_discussion_points")
+        flat["previousDiscussionPoints"] = "; ".join(discussion_points[:5]) if discussion_points else "None"
         
-        flat["highest_qualification"] = flat["highestQualification"]
-        flat["english_proficiency"] = flat["ieltsPteStatus"]
+        concerns = get("concerns") or get("student_concerns")
+        flat["studentConcerns"] = " | ".join(concerns) if concerns else "None raised"
         
-        flat["previous_calls_count"] = str(context.get("previous_calls_count", 0))
-        flat["last_call_date"] = str(context.get("last_call_date", "Never"))
-        flat["last_call_summary"] = flat["previousCallSummary"]
-        flat["overall_interest_level"] = flat["studentInterestLevel"]
-        flat["qualification_score"] = str(context.get("qualification_score", 0))
+        flat["has_applications"] = "yes" if get("has_applications") else "no"
         
-        flat["previous_discussion_points"] = flat["previousDiscussionPoints"]
+        # The builders always fill these keys, so index directly. join() gets
+        # a list: it materialises a generator into one first anyway.
+        apps = get("applications")
+        flat["applications_summary"] = "; ".join([
+            f"{a['university']} - {a['program']} ({a['status']})" for a in apps[:3]
+        ]) if apps else "No applications yet"
         
-        flat["pending_tasks_count"] = str(context.get("pending_tasks_count", 0))
-        pending = context.get("pending_tasks", [])
-        if pending:
-            tasks_summary = "; ".join([t.get("notes", "")[:50] for t in pending[:3]])
-            flat["pending_tasks_summary"] = tasks_summary
-        else:
-            flat["pending_tasks_summary"] = "No pending tasks"
+        records = get("academic_records")
+        flat["academic_summary"] = "; ".join([
+            f"{r['degree']} from {r['institution']} ({r['year']})" for r in records[:2]
+        ]) if records else "No academic records"
         
-        notes = context.get("counseling_notes", "")
-        flat["counseling_notes"] = notes[:500] if notes else "No notes"
+        pending = get("pending_tasks")
+        flat["pending_tasks_summary"] = "; ".join([
+            t["notes"][:50] for t in pending[:3]
+        ]) if pending else "No pending tasks"
         
-        flat["special_requirements"] = ", ".join(context.get("special_requirements", [])) or "None"
-        flat["preferred_country"] = flat["preferredCountry"]
+        notes = get("counseling_notes")
+        flat["counseling_notes"] = notes[:500] if notes else "No notes"
         
-        flat["talking_points"] = flat["keyTopics"]
+        # === Legacy/Additional Variables (backwards compatibility) ===
+        for alias, source in _ALIASED_FIELDS:
+            flat[alias] = flat[source]
         
         return flat
     
@@ -187,8 +306,6 @@ class FollowUpGenerator:
     
     def _get_application_context(self, applicant):
         """Get application status and details."""
-        from ..models import Application
-        
         context = {
             "has_applications": False,
             "application_count": 0,
@@ -199,27 +316,31 @@ class FollowUpGenerator:
         }
         
         try:
-            applications = Application.objects.filter(applicant=applicant).order_by('-created_at')
+            applications = applicant.recent_applications
             
-            if applications.exists():
+            if applications:
                 context["has_applications"] = True
-                context["application_count"] = applications.count()
+                if len(applications) < APPLICATIONS_SHOWN:
+                    context["application_count"] = len(applications)
+                else:
+                    context["application_count"] = applicant.applications.count()
                 
-                for app in applications[:5]:
+                for app in applications:
+                    country = app.country
                     app_info = {
-                        "university": app.university or "Unknown",
+                        "university": app.university_name or "Unknown",
                         "program": app.program or "Unknown",
                         "status": app.status or "pending",
                         "intake": app.intake or "",
                     }
                     context["applications"].append(app_info)
                     
-                    if app.country and app.country not in context["target_countries"]:
-                        context["target_countries"].append(app.country)
-                    if app.university and app.university not in context["target_universities"]:
-                        context["target_universities"].append(app.university)
+                    if country and country not in context["target_countries"]:
+                        context["target_countries"].append(country)
+                    if app.university_name and app.university_name not in context["target_universities"]:
+                        context["target_universities"].append(app.university_name)
                 
-                context["latest_application_status"] = applications.first().status
+                context["latest_application_status"] = applications[0].status
         except Exception as e:
             logger.error(f"Error getting application context: {e}")
         
@@ -252,8 +373,6 @@ class FollowUpGenerator:
     
     def _get_academic_context(self, applicant):
         """Get academic background."""
-        from ..models import AcademicRecord
-        
         context = {
             "academic_records": [],
             "highest_qualification": None,
@@ -261,9 +380,7 @@ class FollowUpGenerator:
         }
         
         try:
-            records = AcademicRecord.objects.filter(applicant=applicant).order_by('-year_of_completion')
-            
-            for record in records[:3]:
+            for record in applicant.top_academic_records:
                 context["academic_records"].append({
                     "degree": record.degree or "",
                     "institution": record.institution or "",
@@ -274,10 +391,9 @@ class FollowUpGenerator:
             if context["academic_records"]:
                 context["highest_qualification"] = context["academic_records"][0]["degree"]
             
-            if applicant.lead:
-                context["english_proficiency"] = applicant.lead.english_test_scores or ""
-                if not context["highest_qualification"]:
-                    context["highest_qualification"] = applicant.lead.highest_qualification or ""
+            context["english_proficiency"] = applicant.english_test_scores or ""
+            if not context["highest_qualification"]:
+                context["highest_qualification"] = applicant.highest_qualification or ""
         except Exception as e:
             logger.error(f"Error getting academic context: {e}")
         
@@ -285,8 +401,6 @@ class FollowUpGenerator:
     
     def _get_call_history_context(self, applicant):
         """Get previous call history and summaries."""
-        from ..models import CallRecord
-        
         context = {
             "previous_calls_count": 0,
             "last_call_date": None,
@@ -296,12 +410,12 @@ class FollowUpGenerator:
         }
         
         try:
-            calls = CallRecord.objects.filter(applicant=applicant).order_by('-created_at')
-            context["previous_calls_count"] = calls.count()
+            calls = applicant.latest_calls
             
-            if calls.exists():
-                last_call = calls.first()
-                context["last_call_date"] = last_call.created_at.strftime("%Y-%m-%d")
+            if calls:
+                context["previous_calls_count"] = applicant.call_count
+                last_call = calls[0]
+                context["last_call_date"] = last_call.created_at.date().isoformat()
                 
                 if last_call.ai_analysis_result:
                     analysis = last_call.ai_analysis_result
@@ -319,28 +433,30 @@ class FollowUpGenerator:
     
     def _get_pending_tasks_context(self, applicant, exclude_task=None):
         """Get pending follow-up tasks."""
-        from ..models import FollowUp
-        
         context = {
             "pending_tasks": [],
             "pending_tasks_count": 0,
         }
         
         try:
-            tasks = FollowUp.objects.filter(
-                lead=applicant,
-                completed=False
-            ).exclude(status__in=['completed', 'cancelled'])
+            tasks = applicant.open_followups
+            truncated = len(tasks) > PENDING_TASKS_SHOWN
             
             if exclude_task:
-                tasks = tasks.exclude(id=exclude_task.id)
+                tasks = [t for t in tasks if t.id != exclude_task.id]
             
-            context["pending_tasks_count"] = tasks.count()
+            if truncated:
+                open_tasks = self._open_followups(applicant.followups.all())
+                if exclude_task:
+                    open_tasks = open_tasks.exclude(id=exclude_task.id)
+                context["pending_tasks_count"] = open_tasks.count()
+            else:
+                context["pending_tasks_count"] = len(tasks)
             
-            for task in tasks[:5]:
+            for task in tasks[:PENDING_TASKS_SHOWN]:
                 context["pending_tasks"].append({
                     "notes": task.notes or "",
-                    "due_at": task.due_at.strftime("%Y-%m-%d %H:%M") if task.due_at else "",
+                    "due_at": task.due_at.isoformat(" ")[:16] if task.due_at else "",  # YYYY-MM-DD HH:MM
                     "channel": task.channel,
                 })
         except Exception as e:
@@ -372,46 +488,29 @@ class FollowUpGenerator:
     
     def _generate_talking_points(self, context, reason):
         """Generate AI talking points based on context."""
-        points = []
-        
         if reason == "document_collection":
             missing = context.get("missing_documents", [])
-            if missing:
-                points.append(f"Collect missing documents: {', '.join(missing[:3])}")
-            points.append("Explain document requirements and deadlines")
-            points.append("Offer assistance with document preparation")
+            points = [f"Collect missing documents: {', '.join(missing[:3])}"] if missing else []
+            points.extend(_STATIC_TALKING_POINTS[reason])
             
         elif reason == "enrollment_followup":
-            points.append("Discuss enrollment decision and any concerns")
-            points.append("Answer questions about university/program")
-            points.append("Confirm next steps in admission process")
+            points = list(_STATIC_TALKING_POINTS[reason])
             
         elif reason == "application_status":
             status = context.get("latest_application_status", "pending")
-            points.append(f"Update student on application status: {status}")
-            points.append("Address any concerns or questions")
+            points = [f"Update student on application status: {status}", "Address any concerns or questions"]
             if status == "pending":
                 points.append("Explain expected timeline")
                 
         else:
-            if context.get("document_status") in ["pending", "partial", "not_started"]:
+            points = []
+            if context.get("document_status") in _DOCUMENTS_OUTSTANDING:
                 points.append("Inquire about document preparation progress")
-            
-            if context.get("has_applications"):
-                points.append("Provide update on application status")
-            else:
-                points.append("Discuss study abroad interests and program options")
-            
-            if context.get("previous_calls_count", 0) > 0:
-                points.append("Follow up on previous discussion points")
-            else:
-                points.append("Introduce services and gather student requirements")
-            
-            interest = context.get("overall_interest_level", "unknown")
-            if interest == "high":
-                points.append("Encourage enrollment and offer fast-track support")
-            elif interest == "low":
-                points.append("Address concerns and re-engage interest")
+            points.append(_APPLICATION_POINT[bool(context.get("has_applications"))])
+            points.append(_CALL_HISTORY_POINT[context.get("previous_calls_count", 0) > 0])
+            interest_point = _INTEREST_POINTS.get(context.get("overall_interest_level", "unknown"))
+            if interest_point:
+                points.append(interest_point)
         
         return points[:5]
     
@@ -431,26 +530,10 @@ class FollowUpGenerator:
         Returns:
             FollowUp: The created follow-up task
         """
-        from ..models import FollowUp
-        
-        # ============== WALK-IN LEAD PROTECTION ==============
-        # Skip AI automation for manual-only leads (walk-ins)
-        if hasattr(applicant, 'is_manual_only') and applicant.is_manual_only:
-            logger.info(f"Skipping AI follow-up for manual-only lead {applicant.id}")
-            return None
-        
-        if hasattr(applicant, 'should_skip_ai_automation') and applicant.should_skip_ai_automation():
-            logger.info(f"Skipping AI follow-up for lead {applicant.id} (walk-in or manual-only)")
+        if self._skips_ai_automation(applicant):
             return None
-        # ====================================================
         
-        if not due_at:
-            if priority == "HIGH":
-                due_at = timezone.now() + timedelta(minutes=5)
-            elif priority == "MEDIUM":
-                due_at = timezone.now() + timedelta(minutes=30)
-            else:
-                due_at = timezone.now() + timedelta(hours=2)
+        due_at = due_at or self._default_due_at(priority)
         
         call_context = self.generate_call_context(
             applicant=applicant,
@@ -458,29 +541,88 @@ class FollowUpGenerator:
             notes=notes,
         )
         
-        metadata = {
-            "call_context": call_context,
-            "priority": priority,
-            "auto_generated": True,
-            "generated_at": timezone.now().isoformat(),
-        }
-        
-        if not notes and reason:
-            notes = self._generate_task_notes(reason, call_context)
-        
         followup = FollowUp.objects.create(
             lead=applicant,
-            channel="ai_call",
-            notes=notes or f"AI call follow-up: {reason or 'general'}",
-            due_at=due_at,
-            status="scheduled",
-            assigned_to=assigned_to,
-            metadata=metadata,
+            **self._followup_fields(call_context, reason, notes, due_at, assigned_to, priority),
         )
         
         logger.info(f"Created AI follow-up {followup.id} for applicant {applicant.id}")
         return followup
     
+    def bulk_create_ai_followups(self, applicants, reason=None, notes=None, due_at=None,
+                                 assigned_to=None, priority="MEDIUM"):
+        """
+        create_ai_followup() for many leads at once.
+        
+        The leads are re-read through prefetch_for_context() in one go, their
+        contexts are built in memory and the tasks go in with a single
+        bulk_create, instead of a context fan-out and an INSERT per lead.
+        
+        Returns:
+            list[FollowUp]: The created tasks (manual-only leads are skipped)
+        """
+        ids = [a.pk for a in applicants if a.pk]
+        if not ids:
+            return []
+        
+        leads = self.prefetch_for_context(Lead.objects.filter(pk__in=ids)).in_bulk()
+        due_at = due_at or self._default_due_at(priority)
+        
+        followups = []
+        for lead_id in dict.fromkeys(ids):
+            lead = leads.get(lead_id)
+            if lead is None or self._skips_ai_automation(lead):
+                continue
+            call_context = self.generate_call_context(applicant=lead, reason=reason, notes=notes)
+            followups.append(FollowUp(
+                lead=lead,
+                **self._followup_fields(call_context, reason, notes, due_at, assigned_to, priority),
+            ))
+        
+        created = FollowUp.objects.bulk_create(followups, batch_size=500)
+        # bulk_create skips post_save, so drop the contexts cached above
+        cache.delete_many([self._context_cache_key(f.lead_id) for f in created])
+        
+        logger.info(f"Created {len(created)} AI follow-ups in bulk")
+        return created
+    
+    def _skips_ai_automation(self, applicant):
+        """Walk-in / manual-only leads never get automated AI calls."""
+        if hasattr(applicant, 'is_manual_only') and applicant.is_manual_only:
+            logger.info(f"Skipping AI follow-up for manual-only lead {applicant.id}")
+            return True
+        
+        if hasattr(applicant, 'should_skip_ai_automation') and applicant.should_skip_ai_automation():
+            logger.info(f"Skipping AI follow-up for lead {applicant.id} (walk-in or manual-only)")
+            return True
+        return False
+    
+    def _default_due_at(self, priority):
+        if priority == "HIGH":
+            return timezone.now() + timedelta(minutes=5)
+        elif priority == "MEDIUM":
+            return timezone.now() + timedelta(minutes=30)
+        return timezone.now() + timedelta(hours=2)
+    
+    def _followup_fields(self, call_context, reason, notes, due_at, assigned_to, priority):
+        """FollowUp field values shared by the single and bulk create paths."""
+        if not notes and reason:
+            notes = self._generate_task_notes(reason, call_context)
+        
+        return {
+            "channel": "ai_call",
+            "notes": notes or f"AI call follow-up: {reason or 'general'}",
+            "due_at": due_at,
+            "status": "scheduled",
+            "assigned_to": assigned_to,
+            "metadata": {
+                "call_context": call_context,
+                "priority": priority,
+                "auto_generated": True,
+                "generated_at": timezone.now().isoformat(),
+            },
+        }
+    
     def _generate_task_notes(self, reason, context):
         """Generate descriptive task notes based on reason and context."""
         student = context.get("student_name", "Student")
@@ -534,6 +676,43 @@ class FollowUpGenerator:
         
         logger.info(f"Enriched task {task.id} with call context")
         return context
+    
+    def bulk_enrich_tasks(self, tasks):
+        """
+        enrich_existing_task() for many tasks at once.
+        
+        Leads are loaded through prefetch_for_context() in one pass and all
+        metadata is written back with a single bulk_update.
+        
+        Returns:
+            list[FollowUp]: The tasks that were enriched (tasks without a lead are skipped)
+        """
+        tasks = [t for t in tasks if t.lead_id]
+        if not tasks:
+            return []
+        
+        leads = self.prefetch_for_context(Lead.objects.filter(pk__in={t.lead_id for t in tasks})).in_bulk()
+        enriched_at = timezone.now().isoformat()
+        
+        for task in tasks:
+            context = self.generate_call_context(
+                applicant=leads.get(task.lead_id),
+                reason=task.metadata.get("reason") if task.metadata else None,
+                notes=task.notes,
+                task=task,
+            )
+            task.metadata = {
+                **(task.metadata or {}),
+                "call_context": context,
+                "context_enriched_at": enriched_at,
+            }
+        
+        # Contexts don't read task metadata, so skipping post_save here leaves
+        # no cached context stale.
+        FollowUp.objects.bulk_update(tasks, ["metadata"], batch_size=200)
+        
+        logger.info(f"Enriched {len(tasks)} tasks with call context")
+        return tasks
 
 
 followup_generator = FollowUpGenerator()
@@ -3,6 +3,7 @@
 Google Ads API client for fetching real campaign data.
 """
 import logging
+from functools import lru_cache
 from decimal import Decimal
 from datetime import datetime
 
@@ -22,23 +23,35 @@ except ImportError:
 def get_google_ads_client(credentials: dict):
     """
     Create a Google Ads API client from stored credentials.
+    Clients are reused per credential set, so repeated fetches for the same
+    account don't rebuild the client and its gRPC channel every time.
     """
     if not GOOGLE_ADS_AVAILABLE:
         raise Exception("Google Ads SDK not installed. Run: pip install google-ads")
     
+    return _cached_client(
+        credentials.get("developer_token"),
+        credentials.get("client_id"),
+        credentials.get("client_secret"),
+        credentials.get("refresh_token"),
+        credentials.get("login_customer_id"),
+    )
+
+
+@lru_cache(maxsize=32)
+def _cached_client(developer_token, client_id, client_secret, refresh_token, login_customer_id):
     config = {
-        "developer_token": credentials.get("developer_token"),
-        "client_id": credentials.get("client_id"),
-        "client_secret": credentials.get("client_secret"),
-        "refresh_token": credentials.get("refresh_token"),
+        "developer_token": developer_token,
+        "client_id": client_id,
+        "client_secret": client_secret,
+        "refresh_token": refresh_token,
         "use_proto_plus": True,
     }
     
-    if credentials.get("login_customer_id"):
-        config["login_customer_id"] = credentials["login_customer_id"]
+    if login_customer_id:
+        config["login_customer_id"] = login_customer_id
     
-    client = GoogleAdsClient.load_from_dict(config)
-    return client
+    return GoogleAdsClient.load_from_dict(config)
 
 
 def fetch_google_ads_campaigns(integration) -> list:
@@ -2,26 +2,55 @@
 """
 Meta (Facebook) Marketing API client for fetching real campaign data.
 """
+import hashlib
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
 from datetime import datetime, timedelta
 
+from django.core.cache import cache
+
 logger = logging.getLogger(__name__)
 
+DATE_PRESET = 'last_30d'
+# Meta only refreshes insights every few minutes; repeat syncs within this
+# window reuse the previous fetch.
+CAMPAIGNS_CACHE_TIMEOUT = 300
+
+# Graph API field names (the values behind Campaign.Field / AdsInsights.Field)
+_CAMPAIGN_FIELDS = [
+    'id', 'name', 'status', 'objective',
+    'daily_budget', 'lifetime_budget', 'start_time', 'stop_time',
+]
+_INSIGHT_FIELDS = ['campaign_id', 'spend', 'impressions', 'clicks', 'ctr', 'cpc', 'cpm']
+# Graph API pages default to 25 rows; ask for more so a typical account's
+# campaigns and insights each come back in one page.
+_PAGE_SIZE = 500
+_STATUS_MAP = {"ACTIVE": "active", "PAUSED": "paused", "DELETED": "ended", "ARCHIVED": "ended"}
+_RATE_PLACES = Decimal("0.0001")
+_MONEY_PLACES = Decimal("0.01")
+_HUNDRED = Decimal(100)
+
+
+def _parse_date(value):
+    """Graph API timestamp ("2024-01-31T10:00:00+0000") -> date, or None."""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value).date()
+    except ValueError:
+        return None
+
 # Try to import Facebook Business SDK - may not be available
 try:
     from facebook_business.api import FacebookAdsApi
     from facebook_business.adobjects.adaccount import AdAccount
-    from facebook_business.adobjects.campaign import Campaign
-    from facebook_business.adobjects.adsinsights import AdsInsights
     from facebook_business.exceptions import FacebookRequestError
     META_ADS_AVAILABLE = True
 except ImportError:
     META_ADS_AVAILABLE = False
     FacebookAdsApi = None
     AdAccount = None
-    Campaign = None
-    AdsInsights = None
     FacebookRequestError = Exception
 
 
@@ -43,6 +72,27 @@ def get_meta_ads_client(access_token: str, app_secret: str = None, app_id: str =
 def fetch_meta_ads_campaigns(integration) -> list:
     """
     Fetch real campaign data from Meta Marketing API.
+    Results are cached briefly; see iter_meta_ads_campaigns() to stream rows.
+    """
+    # Scoped to this integration and its token: another integration naming the
+    # same account_id must not be served data its own token never fetched.
+    token_hash = hashlib.sha256((integration.access_token or "").encode()).hexdigest()[:16]
+    cache_key = f"meta_ads:{integration.pk}:{token_hash}:{integration.account_id}:{DATE_PRESET}"
+    cached = cache.get(cache_key)
+    if cached is not None:
+        return cached
+    
+    campaigns = list(iter_meta_ads_campaigns(integration))
+    
+    logger.info(f"Fetched {len(campaigns)} campaigns from Meta Ads for account {integration.account_id}")
+    cache.set(cache_key, campaigns, CAMPAIGNS_CACHE_TIMEOUT)
+    return campaigns
+
+
+def iter_meta_ads_campaigns(integration):
+    """
+    Yield campaign rows from Meta Marketing API one at a time.
+    Later campaign pages are only requested as the caller consumes rows.
     """
     if not META_ADS_AVAILABLE:
         raise Exception("Meta Ads SDK not installed. Run: pip install facebook-business")
@@ -70,97 +120,29 @@ def fetch_meta_ads_campaigns(integration) -> list:
         
         ad_account = AdAccount(account_id)
         
-        # Fetch campaigns with insights
-        campaigns_data = ad_account.get_campaigns(
-            fields=[
-                Campaign.Field.id,
-                Campaign.Field.name,
-                Campaign.Field.status,
-                Campaign.Field.objective,
-                Campaign.Field.daily_budget,
-                Campaign.Field.lifetime_budget,
-                Campaign.Field.start_time,
-                Campaign.Field.stop_time,
-            ]
-        )
-        
-        campaigns = []
-        for campaign in campaigns_data:
-            campaign_id = campaign.get(Campaign.Field.id)
-            
-            # Fetch insights for this campaign
+        # The campaign list and the account-level insights (one call covering
+        # every campaign) are independent requests, so run them side by side.
+        # Insights are drained up front for the join; the campaign cursor
+        # holds its first page and loads the rest while rows are consumed.
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            f_campaigns = pool.submit(
+                ad_account.get_campaigns,
+                fields=_CAMPAIGN_FIELDS,
+                params={'limit': _PAGE_SIZE},
+            )
+            f_insights = pool.submit(lambda: list(ad_account.get_insights(
+                fields=_INSIGHT_FIELDS,
+                params={'date_preset': DATE_PRESET, 'level': 'campaign', 'limit': _PAGE_SIZE}
+            )))
+            campaigns_data = f_campaigns.result()
             try:
-                insights = Campaign(campaign_id).get_insights(
-                    fields=[
-                        AdsInsights.Field.spend,
-                        AdsInsights.Field.impressions,
-                        AdsInsights.Field.clicks,
-                        AdsInsights.Field.ctr,
-                        AdsInsights.Field.cpc,
-                        AdsInsights.Field.cpm,
-                    ],
-                    params={'date_preset': 'last_30d'}
-                )
-                insight = insights[0] if insights else {}
+                insights_by_id = {i.get('campaign_id'): i for i in f_insights.result()}
             except Exception as e:
-                logger.warning(f"Could not fetch insights for campaign {campaign_id}: {e}")
-                insight = {}
-            
-            # Map status
-            status_map = {"ACTIVE": "active", "PAUSED": "paused", "DELETED": "ended", "ARCHIVED": "ended"}
-            raw_status = campaign.get(Campaign.Field.status, "")
-            status = status_map.get(raw_status, "draft")
-            
-            # Parse budgets (Meta returns in cents)
-            daily_budget = campaign.get(Campaign.Field.daily_budget)
-            lifetime_budget = campaign.get(Campaign.Field.lifetime_budget)
-            
-            # Parse dates
-            start_time = campaign.get(Campaign.Field.start_time)
-            stop_time = campaign.get(Campaign.Field.stop_time)
-            start_date = None
-            end_date = None
-            
-            if start_time:
-                try:
-                    start_date = datetime.fromisoformat(start_time.replace('Z', '+00:00')).date()
-                except:
-                    pass
-            if stop_time:
-                try:
-                    end_date = datetime.fromisoformat(stop_time.replace('Z', '+00:00')).date()
-                except:
-                    pass
-            
-            # Extract metrics from insights
-            spend = Decimal(str(insight.get('spend', 0) or 0))
-            impressions = int(insight.get('impressions', 0) or 0)
-            clicks = int(insight.get('clicks', 0) or 0)
-            ctr = Decimal(str(insight.get('ctr', 0) or 0))
-            cpc = Decimal(str(insight.get('cpc', 0) or 0))
-            cpm = Decimal(str(insight.get('cpm', 0) or 0))
-            
-            campaigns.append({
-                "external_campaign_id": str(campaign_id),
-                "name": campaign.get(Campaign.Field.name, f"Campaign {campaign_id}"),
-                "status": status,
-                "objective": campaign.get(Campaign.Field.objective),
-                "daily_budget": Decimal(str(int(daily_budget) / 100)) if daily_budget else None,
-                "lifetime_budget": Decimal(str(int(lifetime_budget) / 100)) if lifetime_budget else None,
-                "total_spend": spend,
-                "currency": "USD",
-                "impressions": impressions,
-                "clicks": clicks,
-                "conversions": 0,  # Would need conversion tracking setup
-                "ctr": ctr.quantize(Decimal("0.0001")),
-                "cpc": cpc.quantize(Decimal("0.01")),
-                "cpm": cpm.quantize(Decimal("0.01")),
-                "start_date": start_date,
-                "end_date": end_date,
-            })
+                logger.warning(f"Could not fetch campaign insights for account {account_id}: {e}")
+                insights_by_id = {}
         
-        logger.info(f"Fetched {len(campaigns)} campaigns from Meta Ads for account {integration.account_id}")
-        return campaigns
+        for campaign in campaigns_data:
+            yield _campaign_row(campaign, insights_by_id.get(campaign.get('id'), {}))
         
     except FacebookRequestError as ex:
         logger.error(f"Meta Ads API error: {ex.api_error_message()}")
@@ -168,3 +150,42 @@ def fetch_meta_ads_campaigns(integration) -> list:
     except Exception as e:
         logger.error(f"Error fetching Meta Ads campaigns: {e}")
         raise
+
+
+def _campaign_row(campaign, insight):
+    """Map a Graph API campaign and its insights to AdCampaign field values."""
+    campaign_id = campaign.get('id')
+    
+    # Map status
+    status = _STATUS_MAP.get(campaign.get('status', ""), "draft")
+    
+    # Parse budgets (Meta returns in cents)
+    daily_budget = campaign.get('daily_budget')
+    lifetime_budget = campaign.get('lifetime_budget')
+    
+    # Extract metrics from insights (Meta sends them as decimal strings)
+    spend = Decimal(insight.get('spend') or 0)
+    impressions = int(insight.get('impressions') or 0)
+    clicks = int(insight.get('clicks') or 0)
+    ctr = Decimal(insight.get('ctr') or 0)
+    cpc = Decimal(insight.get('cpc') or 0)
+    cpm = Decimal(insight.get('cpm') or 0)
+    
+    return {
+        "external_campaign_id": str(campaign_id),
+        "name": campaign.get('name', f"Campaign {campaign_id}"),
+        "status": status,
+        "objective": campaign.get('objective'),
+        "daily_budget": Decimal(daily_budget) / _HUNDRED if daily_budget else None,
+        "lifetime_budget": Decimal(lifetime_budget) / _HUNDRED if lifetime_budget else None,
+        "total_spend": spend,
+        "currency": "USD",
+        "impressions": impressions,
+        "clicks": clicks,
+        "conversions": 0,  # Would need conversion tracking setup
+        "ctr": ctr.quantize(_RATE_PLACES),
+        "cpc": cpc.quantize(_MONEY_PLACES),
+        "cpm": cpm.quantize(_MONEY_PLACES),
+        "start_date": _parse_date(campaign.get('start_time')),
+        "end_date": _parse_date(campaign.get('stop_time')),
+    }
@@ -0,0 +1,18 @@
+# crm_app/services/openai_client.py
+"""
+Shared OpenAI client for the CRM's AI services.
+"""
+from functools import lru_cache
+
+from openai import OpenAI
+
+
+@lru_cache(maxsize=8)
+def get_openai_client(api_key: str) -> OpenAI:
+    """
+    Return a process-wide OpenAI client for `api_key`.
+    The client owns an httpx connection pool, so reusing it keeps
+    connections to api.openai.com alive across calls instead of paying a
+    new TLS handshake every time an analyzer or assistant is constructed.
+    """
+    return OpenAI(api_key=api_key)
@@ -4,15 +4,19 @@ Generates personalized WhatsApp messages using OpenAI GPT-4
 Handles both post-call welcome messages and incoming message responses
 """
 
-from openai import OpenAI
 import os
 import json
 import logging
 from typing import Dict, Optional, List
 from django.conf import settings
 
+from .openai_client import get_openai_client
+
 logger = logging.getLogger(__name__)
 
+# Phrases in a student's message that hand the conversation to a human counselor
+ESCALATION_KEYWORDS = ('angry', 'complaint', 'issue', 'problem', 'refund', 'cancel', 'speak to human', 'manager')
+
 
 class WhatsAppAssistant:
     """AI-powered WhatsApp assistant for generating personalized messages"""
@@ -21,7 +25,7 @@ class WhatsAppAssistant:
         api_key = os.getenv('OPENAI_API_KEY')
         if not api_key:
             raise ValueError("OPENAI_API_KEY environment variable not set")
-        self.client = OpenAI(api_key=api_key)
+        self.client = get_openai_client(api_key)
         self.model = os.getenv('OPENAI_MODEL', 'gpt-4-turbo-preview')
     
     def generate_post_call_message(self, call_record, lead_or_applicant) -> Dict:
@@ -162,8 +166,8 @@ Recent Call Context:
 """
             
             # Check for escalation triggers
-            escalation_keywords = ['angry', 'complaint', 'issue', 'problem', 'refund', 'cancel', 'speak to human', 'manager']
-            requires_escalation = any(keyword.lower() in incoming_text.lower() for keyword in escalation_keywords)
+            incoming_lower = incoming_text.lower()
+            requires_escalation = any(keyword in incoming_lower for keyword in ESCALATION_KEYWORDS)
             
             prompt = f"""You are an AI counselor assistant for Cybrik Solutions, an education consultancy.
 A student has sent you a message via WhatsApp. Respond helpfully and professionally.
@@ -3,10 +3,15 @@
 Meta WhatsApp Business API client for sending messages.
 Uses Cloud API: https://developers.facebook.com/docs/whatsapp/cloud-api
 """
+import hmac
 import logging
 import requests
+import ujson
+from functools import lru_cache
 from django.conf import settings
+from requests.adapters import HTTPAdapter
 from typing import Optional, Dict, Any
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
@@ -14,6 +19,29 @@ logger = logging.getLogger(__name__)
 WHATSAPP_API_BASE = "https://graph.facebook.com/v18.0"
 
 
+@lru_cache(maxsize=1)
+def _session() -> requests.Session:
+    """
+    Shared HTTP session so sends reuse pooled keep-alive connections to the
+    Graph API instead of a new TCP/TLS handshake per message.
+    Connection failures and 429 rate-limit responses are retried with
+    jittered exponential backoff (honouring Retry-After): in both cases
+    Meta never accepted the message. Timeouts and 5xx are not retried, as
+    the message may already have gone out.
+    """
+    session = requests.Session()
+    retry = Retry(
+        total=3, connect=3, read=0, status=3,
+        status_forcelist=(429,),
+        allowed_methods=frozenset({"GET", "POST"}),
+        backoff_factor=0.5, backoff_jitter=0.25,
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=50, max_retries=retry))
+    return session
+
+
 def get_whatsapp_config():
     """Get WhatsApp configuration from settings."""
     return {
@@ -71,20 +99,20 @@ def send_template_message(
         payload["template"]["components"] = components
     
     try:
-        response = requests.post(url, headers=headers, json=payload, timeout=30)
-        result = response.json()
+        response = _session().post(url, headers=headers, data=ujson.dumps(payload), timeout=30)
+        result = ujson.loads(response.content)
         
         if response.ok:
             message_id = result.get("messages", [{}])[0].get("id")
-            logger.info(f"WhatsApp template '{template_name}' sent to {clean_phone}, message_id: {message_id}")
+            logger.info("WhatsApp template '%s' sent to %s, message_id: %s", template_name, clean_phone, message_id)
             return {"success": True, "message_id": message_id, "response": result}
         else:
             error = result.get("error", {})
-            logger.error(f"WhatsApp send failed: {error.get('message', 'Unknown error')}")
+            logger.error("WhatsApp send failed: %s", error.get('message', 'Unknown error'))
             return {"success": False, "error": error.get("message", "Unknown error"), "response": result}
             
-    except requests.RequestException as e:
-        logger.exception(f"WhatsApp API request failed: {e}")
+    except (requests.RequestException, ValueError) as e:
+        logger.exception("WhatsApp API request failed: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -122,19 +150,19 @@ def send_text_message(to_phone: str, message: str) -> Dict[str, Any]:
     }
     
     try:
-        response = requests.post(url, headers=headers, json=payload, timeout=30)
-        result = response.json()
+        response = _session().post(url, headers=headers, data=ujson.dumps(payload), timeout=30)
+        result = ujson.loads(response.content)
         
         if response.ok:
             message_id = result.get("messages", [{}])[0].get("id")
-            logger.info(f"WhatsApp text sent to {clean_phone}, message_id: {message_id}")
+            logger.info("WhatsApp text sent to %s, message_id: %s", clean_phone, message_id)
             return {"success": True, "message_id": message_id}
         else:
             error = result.get("error", {})
             return {"success": False, "error": error.get("message", "Unknown error")}
             
-    except requests.RequestException as e:
-        logger.exception(f"WhatsApp text send failed: {e}")
+    except (requests.RequestException, ValueError) as e:
+        logger.exception("WhatsApp text send failed: %s", e)
         return {"success": False, "error": str(e)}
 
 
@@ -239,11 +267,11 @@ def verify_webhook(mode: str, token: str, challenge: str) -> Optional[str]:
     """
     verify_token = getattr(settings, 'WHATSAPP_VERIFY_TOKEN', 'cybrik_wa_verify')
     
-    if mode == "subscribe" and token == verify_token:
+    if mode == "subscribe" and hmac.compare_digest((token or "").encode(), verify_token.encode()):
         logger.info("WhatsApp webhook verified successfully")
         return challenge
     
-    logger.warning(f"WhatsApp webhook verification failed - mode: {mode}, token mismatch")
+    logger.warning("WhatsApp webhook verification failed - mode: %s, token mismatch", mode)
     return None
 
 
@@ -289,5 +317,5 @@ def parse_webhook_message(payload: dict) -> Optional[Dict[str, Any]]:
         return None
         
     except Exception as e:
-        logger.exception(f"Error parsing WhatsApp webhook: {e}")
+        logger.exception("Error parsing WhatsApp webhook: %s", e)
         return None
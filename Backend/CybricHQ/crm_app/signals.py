@@ -1,6 +1,6 @@
 from django.db.models.signals import post_save, post_delete, pre_save
 from django.dispatch import receiver
-from .models import Applicant, AcademicRecord, Document, Application, FollowUp, AuditLog, Lead
+from .models import Applicant, AcademicRecord, Document, Application, FollowUp, AuditLog, Lead, CallRecord, Tenant, TenantSettings, UserProfile
 import json
 import logging
 
@@ -127,7 +127,7 @@ def log_applicant_save(sender, instance, created, **kwargs):
         action=action,
         target_type="Applicant",
         target_id=str(instance.id),
-        applicant=instance,
+        lead=instance.lead,
         data=data,
         notes=f"Applicant {action}" + (f": {', '.join(changes.keys())}" if changes else "")
     )
@@ -140,7 +140,7 @@ def log_academic_save(sender, instance, created, **kwargs):
         action=action,
         target_type="AcademicRecord",
         target_id=str(instance.id),
-        applicant=instance.applicant,
+        lead=instance.lead,
         data={"degree": instance.degree, "institution": instance.institution},
         notes=f"Academic Record {action}: {instance.degree}"
     )
@@ -152,7 +152,7 @@ def log_academic_delete(sender, instance, **kwargs):
         action="Deleted",
         target_type="AcademicRecord",
         target_id=str(instance.id),
-        applicant=instance.applicant,
+        lead=instance.lead,
         data={"degree": instance.degree},
         notes=f"Academic Record Deleted: {instance.degree}"
     )
@@ -185,7 +185,6 @@ def log_application_save(sender, instance, created, **kwargs):
 
 @receiver(post_save, sender=FollowUp)
 def log_followup_save(sender, instance, created, **kwargs):
-    # FollowUp links to 'lead' which is an Applicant in this model structure (based on models.py line 204)
     if not instance.lead:
         return
         
@@ -195,7 +194,7 @@ def log_followup_save(sender, instance, created, **kwargs):
         action=action,
         target_type="FollowUp",
         target_id=str(instance.id),
-        applicant=instance.lead,
+        lead=instance.lead,
         data={"channel": instance.channel, "notes": instance.notes},
         notes=f"FollowUp {action}: {instance.channel}"
     )
@@ -251,3 +250,54 @@ def capture_application_old_state(sender, instance, **kwargs):
             instance._old_state = None
     else:
         instance._old_state = None
+
+
+@receiver(post_save, sender=Lead)
+@receiver(post_save, sender=Application)
+@receiver(post_delete, sender=Application)
+@receiver(post_save, sender=AcademicRecord)
+@receiver(post_delete, sender=AcademicRecord)
+@receiver(post_save, sender=CallRecord)
+@receiver(post_delete, sender=CallRecord)
+@receiver(post_save, sender=FollowUp)
+@receiver(post_delete, sender=FollowUp)
+def invalidate_followup_call_context(sender, instance, **kwargs):
+    """Drop the lead's cached AI call context when anything it is built from changes"""
+    from .services.followup_generator import FollowUpGenerator
+    lead_id = instance.pk if sender is Lead else instance.lead_id
+    FollowUpGenerator.invalidate(lead_id)
+
+
+@receiver(pre_save, sender=Tenant)
+@receiver(pre_save, sender=TenantSettings)
+def capture_tenant_lookup_old_value(sender, instance, **kwargs):
+    """Remember the slug/custom_domain being replaced so its cached lookup can be dropped too"""
+    field = 'slug' if sender is Tenant else 'custom_domain'
+    instance._old_lookup_value = (
+        sender.objects.filter(pk=instance.pk).values_list(field, flat=True).first()
+        if instance.pk else None
+    )
+
+
+@receiver(post_save, sender=Tenant)
+@receiver(post_delete, sender=Tenant)
+@receiver(post_save, sender=TenantSettings)
+@receiver(post_delete, sender=TenantSettings)
+@receiver(post_save, sender=UserProfile)
+@receiver(post_delete, sender=UserProfile)
+def invalidate_tenant_lookup_cache(sender, instance, **kwargs):
+    """Drop TenantMiddleware's cached domain/slug/user lookups for the tenant"""
+    from .tenant_middleware import invalidate_tenant_lookups
+    old_value = getattr(instance, '_old_lookup_value', None)
+    if sender is Tenant:
+        if old_value and old_value != instance.slug:
+            invalidate_tenant_lookups(slug=old_value)
+        domain = TenantSettings.objects.filter(tenant=instance).values_list('custom_domain', flat=True).first()
+        user_ids = UserProfile.objects.filter(tenant=instance).values_list('user_id', flat=True)
+        invalidate_tenant_lookups(slug=instance.slug, domain=domain, user_ids=list(user_ids))
+    elif sender is UserProfile:
+        invalidate_tenant_lookups(user_ids=[instance.user_id])
+    else:
+        if old_value and old_value != instance.custom_domain:
+            invalidate_tenant_lookups(domain=old_value)
+        invalidate_tenant_lookups(domain=instance.custom_domain)
@@ -7,6 +7,9 @@ When the call connects, Smartflo streams audio to our WebSocket for AI handling.
 
 import requests
 import logging
+from functools import lru_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
@@ -26,6 +29,19 @@ SMARTFLO_AGENT_ID = getattr(settings, 'SMARTFLO_AGENT_ID', '')  # Your Smartflo
 SMARTFLO_VOICEBOT_API_KEY = getattr(settings, 'SMARTFLO_VOICEBOT_API_KEY', '')
 
 
+@lru_cache(maxsize=1)
+def _session() -> requests.Session:
+    """
+    Shared HTTP session so Smartflo calls reuse pooled keep-alive connections
+    instead of a fresh TCP/TLS handshake per request. Only connection
+    failures are retried, so a click-to-call request is never dialled twice.
+    """
+    session = requests.Session()
+    retry = Retry(total=2, connect=2, read=0, status=0, backoff_factor=0.3)
+    session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=50, max_retries=retry))
+    return session
+
+
 def build_lead_context(lead: Lead) -> dict:
     """
     Build comprehensive lead context for AI personalization.
@@ -335,7 +351,7 @@ def initiate_smartflo_call(destination_number: str, websocket_url: str = None, c
     logger.info(f"Using endpoint: {url}")
     
     try:
-        response = requests.post(url, json=payload, headers=headers, timeout=30)
+        response = _session().post(url, json=payload, headers=headers, timeout=30)
         
         if response.status_code == 200:
             data = response.json()
@@ -407,7 +423,7 @@ def end_call(request):
             'Content-Type': 'application/json'
         }
         
-        response = requests.post(url, headers=headers, timeout=10)
+        response = _session().post(url, headers=headers, timeout=10)
         logger.info(f"Call {call_sid} ended, response: {response.status_code}")
         
         return Response({
@@ -437,7 +453,7 @@ def get_call_status(request, call_sid):
             'Content-Type': 'application/json'
         }
         
-        response = requests.get(url, headers=headers, timeout=10)
+        response = _session().get(url, headers=headers, timeout=10)
         
         if response.status_code == 200:
             data = response.json()
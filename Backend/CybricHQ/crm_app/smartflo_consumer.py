@@ -478,11 +478,10 @@ class SmartfloAudioConsumer(AsyncWebsocketConsumer):
             
         logger.info(f"[SMARTFLO] searching DB for lead with candidates: {candidates}")
         
-        for candidate in candidates:
-            lead = Lead.objects.filter(phone=candidate).first()
-            if lead:
-                logger.info(f"[SMARTFLO] Found Lead in DB: {lead.id} - {lead.name}")
-                return build_lead_context(lead)
+        lead = Lead.objects.by_phone(*candidates).first()
+        if lead:
+            logger.info(f"[SMARTFLO] Found Lead in DB: {lead.id} - {lead.name}")
+            return build_lead_context(lead)
                 
         logger.warning("[SMARTFLO] No Lead found in DB for number")
         return None
@@ -537,10 +536,7 @@ class SmartfloAudioConsumer(AsyncWebsocketConsumer):
                     candidates.append('91' + cleaned)
                     candidates.append('+91' + cleaned)
                 
-                for candidate in candidates:
-                    lead = Lead.objects.filter(phone=candidate).first()
-                    if lead:
-                        break
+                lead = Lead.objects.by_phone(*candidates).first()
             
             # Create CallRecord
             call = CallRecord.objects.create(
@@ -749,7 +745,7 @@ class SmartfloAudioConsumer(AsyncWebsocketConsumer):
                 call.metadata['conversation_id'] = conversation_id
                 call.external_call_id = conversation_id
                 
-            call.save()
+            call.save(update_fields=['status', 'metadata', 'external_call_id'])
             logger.info(f"Updated CallRecord {call.id} status to {status}")
 
             # ====== AUTO-UPDATE LEAD STATUS ======
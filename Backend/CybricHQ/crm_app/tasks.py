@@ -4,6 +4,7 @@ from celery import shared_task
 from django.utils import timezone
 from datetime import timedelta
 from .models import Lead, CallRecord, FollowUp, Transcript, Applicant
+from django.core.cache import cache
 from django.core.signing import TimestampSigner
 from django.conf import settings
 from django.db.models import Q
@@ -13,6 +14,23 @@ logger = logging.getLogger(__name__)
 # Constants for upload token (must match views_public.py)
 UPLOAD_TOKEN_SALT = "cybrik-public-upload-v1"
 
+# Stay under Meta's per-number send throughput when a burst of calls completes
+WHATSAPP_SEND_RATE_LIMIT = "80/m"
+POST_CALL_SEND_GUARD_TIMEOUT = 60 * 60 * 24
+# Due follow-up ids fetched per round trip by check_and_initiate_followups
+FOLLOWUP_SCAN_CHUNK_SIZE = 500
+
+
+def _claim_post_call_send(call_record_id, trigger):
+    """
+    Reserve the one post-call send of `trigger` for a call. Returns the guard
+    key, or None if it was already claimed (redelivery, or the call was
+    completed by more than one path).
+    """
+    key = f"whatsapp_post_call:{call_record_id}:{trigger}"
+    return key if cache.add(key, 1, POST_CALL_SEND_GUARD_TIMEOUT) else None
+
+
 def send_welcome_message(lead_id, phone, source):
     """
     Send welcome message via WhatsApp after first contact.
@@ -44,17 +62,17 @@ def send_welcome_message(lead_id, phone, source):
         )
         
         if result.get("success"):
-            logger.info(f"WhatsApp welcome sent to {phone} for lead {lead_id}")
+            logger.info("WhatsApp welcome sent to %s for lead %s", phone, lead_id)
         else:
-            logger.error(f"WhatsApp welcome failed for {phone}: {result.get('error')}")
+            logger.error("WhatsApp welcome failed for %s: %s", phone, result.get('error'))
         
         return result
         
     except Lead.DoesNotExist:
-        logger.error(f"Lead {lead_id} not found for welcome message.")
+        logger.error("Lead %s not found for welcome message.", lead_id)
         return {"success": False, "error": "Lead not found"}
     except Exception as e:
-        logger.exception(f"Error sending WhatsApp welcome: {e}")
+        logger.exception("Error sending WhatsApp welcome: %s", e)
         return {"success": False, "error": str(e)}
 
 def schedule_elevenlabs_call(lead_id=None, applicant_id=None, extra_context=None):
@@ -188,13 +206,13 @@ def schedule_elevenlabs_call(lead_id=None, applicant_id=None, extra_context=None
             call_record.external_call_id = result.get("call_sid")
             call_record.metadata["call_sid"] = result.get("call_sid")
             call_record.metadata["full_response"] = result.get("full_response")
-            call_record.save()
+            call_record.save(update_fields=["status", "external_call_id", "metadata"])
             return {"ok": True, "call_sid": result.get("call_sid"), "call_record_id": call_record.id}
         else:
             logger.error(f"Failed to initiate SmartFlow call: {result.get('error', 'unknown')}")
             call_record.status = "failed"
             call_record.metadata["error"] = result.get("error")
-            call_record.save()
+            call_record.save(update_fields=["status", "metadata"])
             return {"ok": False, "error": result.get("error")}
     
     except Exception as e:
@@ -219,10 +237,11 @@ def check_and_initiate_followups():
         completed=False,
         channel__in=['ai_call', 'phone'],
         status__in=['pending', 'scheduled']
-    ).values_list('id', flat=True)
+    ).order_by('due_at').values_list('id', flat=True)
     
     count = 0
-    for task_id in due_tasks:
+    # Stream ids in chunks so a large backlog isn't loaded into memory at once
+    for task_id in due_tasks.iterator(chunk_size=FOLLOWUP_SCAN_CHUNK_SIZE):
         # Enqueue the heavy lifting
         execute_single_ai_call_task.delay(task_id)
         count += 1
@@ -230,6 +249,16 @@ def check_and_initiate_followups():
     return f"Queued {count} AI calls for execution"
 
 
+@shared_task
+def create_auditlog_partitions():
+    """
+    Periodic task (Beat) to provision upcoming monthly AuditLog partitions
+    so inserts never fall through to the default partition.
+    """
+    from django.core.management import call_command
+    call_command('create_auditlog_partitions')
+
+
 @shared_task(
     bind=True,
     autoretry_for=(Exception,),
@@ -278,7 +307,7 @@ def execute_single_ai_call_task(self, followup_id):
                 task.status = "failed"
                 task.metadata = task.metadata or {}
                 task.metadata["error"] = "No linked lead/applicant"
-                task.save()
+                task.save(update_fields=["status", "metadata"])
                 return "failed_no_user"
 
             logger.info(f"Processing AI call {task.id} for {'Applicant' if is_applicant else 'Lead'} {target_id}")
@@ -350,7 +379,7 @@ def execute_single_ai_call_task(self, followup_id):
                 except Exception:
                     pass
             
-            task.save()
+            task.save(update_fields=["status", "completed", "metadata", "call_record"])
             logger.info(f"Successfully triggered AI call for FollowUp {task.id}")
             return "success"
         else:
@@ -358,7 +387,7 @@ def execute_single_ai_call_task(self, followup_id):
             task.metadata = task.metadata or {}
             task.metadata["error"] = res.get("error", "unknown")
             task.metadata["failed_at"] = timezone.now().isoformat()
-            task.save()
+            task.save(update_fields=["status", "metadata"])
             logger.error(f"Failed to trigger AI call for FollowUp {task.id}: {res.get('error')}")
             # Raising exception triggers retry if configured
             raise Exception(f"Call initiation failed: {res.get('error')}")
@@ -395,9 +424,10 @@ def trigger_scheduled_ai_call(followup_id):
             target_id = task.crm_lead.id
             is_applicant = False
         
-        # Update status
+        # Claim the task; fails if another trigger already started this call
+        if not FollowUp.objects.claim_for_call(task.pk):
+            return {"ok": False, "error": "Task is already being processed"}
         task.status = "in_progress"
-        task.save(update_fields=['status'])
         
         # Fetch previous call summary for context
         previous_call_summary = "No previous calls"
@@ -417,32 +447,38 @@ def trigger_scheduled_ai_call(followup_id):
         except Exception as e:
             logger.warning(f"Could not fetch previous call summary: {e}")
         
-        context = {}
-        if task.metadata and task.metadata.get('call_context'):
-            context = task.metadata['call_context'].copy()
-            context['task_id'] = str(task.id)
-            context['reason'] = 'manual_trigger'
-        else:
-            from .services.followup_generator import followup_generator
-            context = followup_generator.generate_call_context(
-                applicant=task.lead if is_applicant else None,
-                reason='manual_trigger',
-                notes=task.notes,
-                task=task,
+        # The task is now in_progress; any failure from here must release it,
+        # or it would never be picked up or triggered again.
+        try:
+            context = {}
+            if task.metadata and task.metadata.get('call_context'):
+                context = task.metadata['call_context'].copy()
+                context['task_id'] = str(task.id)
+                context['reason'] = 'manual_trigger'
+            else:
+                from .services.followup_generator import followup_generator
+                context = followup_generator.generate_call_context(
+                    applicant=task.lead if is_applicant else None,
+                    reason='manual_trigger',
+                    notes=task.notes,
+                    task=task,
+                )
+                context['task_id'] = str(task.id)
+        
+            # Add follow-up specific context (required by follow-up agent)
+            context['followUpReason'] = task.notes or context.get('followUpReason', 'Scheduled follow-up call')
+            context['callObjective'] = context.get('callObjective', task.notes or 'Follow up with student regarding their inquiry')
+            context['previousCallSummary'] = previous_call_summary
+            context['task_notes'] = task.notes or "Follow up call."
+        
+            res = schedule_elevenlabs_call(
+                applicant_id=target_id if is_applicant else None,
+                lead_id=target_id if not is_applicant else None,
+                extra_context=context
             )
-            context['task_id'] = str(task.id)
-        
-        # Add follow-up specific context (required by follow-up agent)
-        context['followUpReason'] = task.notes or context.get('followUpReason', 'Scheduled follow-up call')
-        context['callObjective'] = context.get('callObjective', task.notes or 'Follow up with student regarding their inquiry')
-        context['previousCallSummary'] = previous_call_summary
-        context['task_notes'] = task.notes or "Follow up call."
-        
-        res = schedule_elevenlabs_call(
-            applicant_id=target_id if is_applicant else None,
-            lead_id=target_id if not is_applicant else None,
-            extra_context=context
-        )
+        except Exception as e:
+            logger.exception("Manual AI call trigger failed for FollowUp %s", task.id)
+            res = {"ok": False, "error": str(e)}
         
         if res.get("ok"):
             task.status = "completed"
@@ -450,13 +486,13 @@ def trigger_scheduled_ai_call(followup_id):
             task.metadata = task.metadata or {}
             task.metadata["automated_call_triggered"] = True
             task.metadata["triggered_at"] = timezone.now().isoformat()
-            task.save()
+            task.save(update_fields=["status", "completed", "metadata"])
             return {"ok": True, "message": "AI call initiated successfully"}
         else:
             task.status = "failed"
             task.metadata = task.metadata or {}
             task.metadata["error"] = res.get("error", "unknown")
-            task.save()
+            task.save(update_fields=["status", "metadata"])
             return {"ok": False, "error": res.get("error", "Failed to initiate call")}
             
     except FollowUp.DoesNotExist:
@@ -473,7 +509,7 @@ def forward_lead_to_elevenlabs(lead_id):
     return schedule_elevenlabs_call(lead_id)
 
 
-@shared_task
+@shared_task(rate_limit=WHATSAPP_SEND_RATE_LIMIT)
 def send_post_call_whatsapp_task(call_record_id):
     """
     Send a WhatsApp document upload request after a successful call.
@@ -483,19 +519,18 @@ def send_post_call_whatsapp_task(call_record_id):
         from .services.whatsapp_client import send_document_request
         from .models import WhatsAppMessage
 
-        call = CallRecord.objects.get(id=call_record_id)
+        call = CallRecord.objects.select_related('lead').get(id=call_record_id)
         
-        # Determine target (Lead or Applicant)
-        target = call.lead or call.applicant
+        target = call.lead
         if not target:
-            logger.warning(f"Call {call_record_id} has no linked Lead/Applicant. Skipping WhatsApp.")
+            logger.warning("Call %s has no linked Lead. Skipping WhatsApp.", call_record_id)
             return "skipped_no_target"
 
         phone = target.phone
         name = getattr(target, 'name', None) or getattr(target, 'first_name', None) or "Student"
         
         if not phone:
-            logger.warning(f"Target {target.id} has no phone. Skipping WhatsApp.")
+            logger.warning("Target %s has no phone. Skipping WhatsApp.", target.id)
             return "skipped_no_phone"
 
         # Generate upload token
@@ -506,34 +541,46 @@ def send_post_call_whatsapp_task(call_record_id):
         frontend_url = getattr(settings, 'FRONTEND_URL', 'https://crm.cybriksolutions.com')
         upload_link = f"{frontend_url.rstrip('/')}/upload?token={token}"
         
-        # Send Message
-        logger.info(f"Sending post-call WhatsApp to {phone} (Call {call_record_id})")
-        result = send_document_request(phone, name, upload_link)
-        
-        # Log Message
-        WhatsAppMessage.objects.create(
-            lead=target if isinstance(target, Lead) else None,
-            applicant=target if isinstance(target, Applicant) else None,
-            tenant=getattr(target, 'tenant', None),
-            direction="outbound",
-            message_type="template",
-            template_name="document_upload_request",
-            from_phone=getattr(settings, 'WHATSAPP_PHONE_NUMBER_ID', '') or "",
-            to_phone=phone,
-            message_body=f"Post-call document request: {upload_link}",
-            message_id=result.get("message_id"),
-            status="sent" if result.get("success") else "failed",
-            error_message=result.get("error") if not result.get("success") else None,
-            metadata={"call_record_id": call_record_id, "trigger": "post_call"}
-        )
+        guard_key = _claim_post_call_send(call_record_id, "post_call")
+        if not guard_key:
+            logger.info("Post-call WhatsApp for call %s already sent. Skipping.", call_record_id)
+            return "skipped_duplicate"
+
+        # Keep the claim only once the message has actually gone out; any
+        # failure or exception below releases it so a retry can send.
+        sent = False
+        try:
+            # Send Message
+            logger.info("Sending post-call WhatsApp to %s (Call %s)", phone, call_record_id)
+            result = send_document_request(phone, name, upload_link)
+            sent = bool(result.get("success"))
+        
+            # Log Message
+            WhatsAppMessage.objects.create(
+                lead=target,
+                tenant_id=target.tenant_id,
+                direction="outbound",
+                message_type="template",
+                template_name="document_upload_request",
+                from_phone=getattr(settings, 'WHATSAPP_PHONE_NUMBER_ID', '') or "",
+                to_phone=phone,
+                message_body=f"Post-call document request: {upload_link}",
+                message_id=result.get("message_id"),
+                status="sent" if result.get("success") else "failed",
+                error_message=result.get("error") if not result.get("success") else None,
+                metadata={"call_record_id": call_record_id, "trigger": "post_call"}
+            )
         
-        return "sent" if result.get("success") else "failed"
+            return "sent" if result.get("success") else "failed"
+        finally:
+            if not sent:
+                cache.delete(guard_key)
 
     except CallRecord.DoesNotExist:
-        logger.error(f"CallRecord {call_record_id} not found for WhatsApp task")
+        logger.error("CallRecord %s not found for WhatsApp task", call_record_id)
         return "call_not_found"
     except Exception as e:
-        logger.exception(f"Error in send_post_call_whatsapp_task: {e}")
+        logger.exception("Error in send_post_call_whatsapp_task: %s", e)
         return "error"
 
 
@@ -548,7 +595,7 @@ def analyze_call_transcript(call_record_id):
     from .services.ai_analyzer import CallAnalyzer
     
     try:
-        call = CallRecord.objects.get(id=call_record_id)
+        call = CallRecord.objects.select_related('lead').get(id=call_record_id)
         
         # Skip if already analyzed
         if call.ai_analyzed:
@@ -567,9 +614,9 @@ def analyze_call_transcript(call_record_id):
         analyzer = CallAnalyzer()
         # Fetch pending tasks for verification
         pending_tasks = []
-        if call.applicant:
+        if call.lead:
             pending_tasks = list(FollowUp.objects.filter(
-                lead=call.applicant, 
+                lead=call.lead, 
                 completed=False
             ))
 
@@ -579,23 +626,25 @@ def analyze_call_transcript(call_record_id):
         call.ai_analysis_result = analysis
         call.ai_quality_score = analysis.get('qualification_score', 0)
         call.ai_analyzed = True
-        call.save()
+        call.save(update_fields=["ai_analysis_result", "ai_quality_score", "ai_analyzed"])
         
         logger.info(f"AI analysis complete for call {call_record_id}. Score: {call.ai_quality_score}")
         
         # Update Applicant Metadata with Document Status
-        if call.applicant:
+        # CallRecord links to the Lead; profile fields live on the lead's applicant record
+        applicant = call.lead.applicants.first() if call.lead else None
+        if applicant:
             doc_status = analysis.get('document_status', {})
             if doc_status:
-                if not call.applicant.metadata:
-                    call.applicant.metadata = {}
+                if not applicant.metadata:
+                    applicant.metadata = {}
                 
                 # Merge or overwrite document status
-                call.applicant.metadata['document_status'] = doc_status.get('status', 'unknown')
-                call.applicant.metadata['missing_documents'] = doc_status.get('missing_documents', [])
-                call.applicant.metadata['submitted_documents'] = doc_status.get('submitted_documents', [])
-                call.applicant.save(update_fields=['metadata'])
-                logger.info(f"Updated document status for applicant {call.applicant.id}: {doc_status.get('status')}")
+                applicant.metadata['document_status'] = doc_status.get('status', 'unknown')
+                applicant.metadata['missing_documents'] = doc_status.get('missing_documents', [])
+                applicant.metadata['submitted_documents'] = doc_status.get('submitted_documents', [])
+                applicant.save(update_fields=['metadata'])
+                logger.info(f"Updated document status for applicant {applicant.id}: {doc_status.get('status')}")
 
             # --- EXTRACT AND SAVE APPLICANT DETAILS ---
             try:
@@ -603,25 +652,25 @@ def analyze_call_transcript(call_record_id):
                 personal = analysis.get('personal_details', {})
                 if personal:
                     updates = []
-                    if personal.get('dob') and not call.applicant.dob:
-                        call.applicant.dob = personal.get('dob')
+                    if personal.get('dob') and not applicant.dob:
+                        applicant.dob = personal.get('dob')
                         updates.append('dob')
-                    if personal.get('passport_number') and not call.applicant.passport_number:
-                        call.applicant.passport_number = personal.get('passport_number')
+                    if personal.get('passport_number') and not applicant.passport_number:
+                        applicant.passport_number = personal.get('passport_number')
                         updates.append('passport_number')
                     
                     # Update metadata for other fields
-                    if not call.applicant.metadata:
-                        call.applicant.metadata = {}
+                    if not applicant.metadata:
+                        applicant.metadata = {}
                     
                     for field in ['city', 'country', 'gender']:
                         if personal.get(field):
-                            call.applicant.metadata[field] = personal.get(field)
+                            applicant.metadata[field] = personal.get(field)
                             updates.append('metadata')
                     
                     if updates:
-                        call.applicant.save(update_fields=list(set(updates)))
-                        logger.info(f"Updated personal details for applicant {call.applicant.id}: {updates}")
+                        applicant.save(update_fields=list(set(updates)))
+                        logger.info(f"Updated personal details for applicant {applicant.id}: {updates}")
 
                 # 2. Academic History
                 academic_history = analysis.get('academic_history', [])
@@ -630,28 +679,28 @@ def analyze_call_transcript(call_record_id):
                     for record in academic_history:
                         # Simple deduplication: check if same degree and institution exists
                         exists = AcademicRecord.objects.filter(
-                            applicant=call.applicant,
+                            lead=call.lead,
                             degree=record.get('degree'),
                             institution=record.get('institution')
                         ).exists()
                         
                         if not exists and record.get('degree'):
                             AcademicRecord.objects.create(
-                                applicant=call.applicant,
+                                lead=call.lead,
                                 institution=record.get('institution'),
                                 degree=record.get('degree'),
                                 year_of_completion=record.get('year'),
                                 grade=record.get('grade'),
                                 score=record.get('score')
                             )
-                            logger.info(f"Created AcademicRecord for applicant {call.applicant.id}: {record.get('degree')}")
+                            logger.info(f"Created AcademicRecord for applicant {applicant.id}: {record.get('degree')}")
 
                 # 3. English Proficiency & Lead Qualification
                 english = analysis.get('english_proficiency', {})
                 if english or analysis.get('qualification_score'):
                     # Update Lead fields if linked
-                    if call.applicant.lead:
-                        lead = call.applicant.lead
+                    if applicant.lead:
+                        lead = applicant.lead
                         lead_updates = []
                         
                         if english:
@@ -682,8 +731,8 @@ def analyze_call_transcript(call_record_id):
                     target_lead = None
                     if call.lead:
                         target_lead = call.lead
-                    elif call.applicant and call.applicant.lead:
-                        target_lead = call.applicant.lead
+                    elif applicant.lead:
+                        target_lead = applicant.lead
                         
                     if target_lead:
                         old_status = target_lead.status
@@ -724,13 +773,13 @@ def analyze_call_transcript(call_record_id):
                 if follow_up.get('needed'):
                     remark += f" Action: Scheduled follow-up ({follow_up.get('reason')})."
                 
-                if call.applicant.counseling_notes:
-                    call.applicant.counseling_notes += remark
+                if applicant.counseling_notes:
+                    applicant.counseling_notes += remark
                 else:
-                    call.applicant.counseling_notes = remark.strip()
+                    applicant.counseling_notes = remark.strip()
                 
-                call.applicant.save(update_fields=['counseling_notes'])
-                logger.info(f"Added AI remark to Applicant {call.applicant.id}")
+                applicant.save(update_fields=['counseling_notes'])
+                logger.info(f"Added AI remark to Applicant {applicant.id}")
             except Exception as e:
                 logger.error(f"Failed to add AI remark: {e}")
             # --- PROCESS TASK VERIFICATION ---
@@ -749,7 +798,7 @@ def analyze_call_transcript(call_record_id):
                             task.metadata['verified_by_ai'] = True
                             task.metadata['verification_evidence'] = evidence
                             task.metadata['verified_at_call_id'] = call_record_id
-                            task.save()
+                            task.save(update_fields=['completed', 'metadata'])
                             logger.info(f"AI verified task {task_id} as completed based on call {call_record_id}")
                     except FollowUp.DoesNotExist:
                         logger.warning(f"AI tried to verify non-existent task {task_id}")
@@ -835,7 +884,7 @@ def analyze_call_transcript(call_record_id):
         follow_up = analysis.get('follow_up', {})
         doc_status = analysis.get('document_status', {})
         
-        if (follow_up.get('needed') or doc_status.get('status') in ['pending', 'partial']) and (call.applicant or call.lead):
+        if (follow_up.get('needed') or doc_status.get('status') in ['pending', 'partial']) and call.lead:
             priority = 'HIGH' if analysis.get('interest_level') == 'high' else 'MEDIUM'
             
             # Construct task notes
@@ -870,8 +919,8 @@ def analyze_call_transcript(call_record_id):
             }
             
             FollowUp.objects.create(
-                lead=call.applicant,
-                crm_lead=call.lead,
+                lead=call.lead,
+                tenant_id=call.lead.tenant_id,
                 channel='ai_call',  # Use AI call channel for automated follow-ups
                 notes=notes,
                 due_at=calculate_follow_up_time(follow_up.get('timing', '2 days')),
@@ -883,7 +932,7 @@ def analyze_call_transcript(call_record_id):
                     'follow_up_analysis': follow_up,  # Full AI analysis of follow-up
                 }
             )
-            logger.info(f"Created AI follow-up task for {'Applicant' if call.applicant else 'Lead'} {call.applicant.id if call.applicant else call.lead.id} with call context")
+            logger.info("Created AI follow-up task for Lead %s with call context", call.lead_id)
             
             # --- AUTO-SEND WHATSAPP DOCUMENT LINK ---
             # Check if FollowUp implies document collection (e.g. "Create task to collect documents")
@@ -892,41 +941,11 @@ def analyze_call_transcript(call_record_id):
             
             # If documents are pending OR the AI explicitly scheduled a document follow-up
             if doc_status.get('status') in ['pending', 'partial'] or missing_docs or is_doc_followup:
-                try:
-                    target = call.applicant or call.lead
-                    if target and target.phone:
-                        from django.conf import settings
-                        from .services.whatsapp_client import send_document_request
-                        from .models import WhatsAppMessage
-                        from .views import generate_upload_token
-
-                        # Generate token and link
-                        token = generate_upload_token(target.id if isinstance(target, Lead) else None, target.tenant_id if hasattr(target, 'tenant_id') else None)
-                        upload_link = f"{settings.FRONTEND_URL}/upload?token={token}"
-                        
-                        name = target.first_name if hasattr(target, 'first_name') else target.name
-                        
-                        # Send WhatsApp template
-                        wa_result = send_document_request(target.phone, name, upload_link)
-                        
-                        # Log message
-                        WhatsAppMessage.objects.create(
-                            lead=target if isinstance(target, Lead) else None,
-                            applicant=target if isinstance(target, Applicant) else None,
-                            tenant=getattr(target, 'tenant', None),
-                            direction="outbound",
-                            message_type="template",
-                            template_name="document_upload_request",
-                            from_phone=getattr(settings, 'WHATSAPP_PHONE_NUMBER_ID', ''),
-                            to_phone=target.phone,
-                            message_body=f"Auto-sent document upload request: {upload_link}",
-                            message_id=wa_result.get("message_id"),
-                            status="sent" if wa_result.get("success") else "failed",
-                            error_message=wa_result.get("error") if not wa_result.get("success") else None,
-                        )
-                        logger.info(f"Auto-sent WhatsApp document request to {target.phone}")
-                except Exception as e:
-                    logger.error(f"Failed to auto-send WhatsApp document request: {e}")
+                # Queued rather than sent inline so the analysis worker doesn't
+                # wait on Meta's API; the task builds the link and logs it.
+                if call.lead.phone:
+                    send_post_call_whatsapp_task.delay(call.id)
+                    logger.info(f"Queued WhatsApp document request for Lead {call.lead_id}")
 
             # Send automated email if needed
 
@@ -934,9 +953,9 @@ def analyze_call_transcript(call_record_id):
                 try:
                     from .services.email_service import EmailService
                     email_service = EmailService()
-                    sent = email_service.send_follow_up(call.applicant, analysis)
+                    sent = email_service.send_follow_up(call.lead, analysis)
                     if sent:
-                        logger.info(f"Sent automated follow-up email to {call.applicant.email}")
+                        logger.info("Sent automated follow-up email to %s", call.lead.email)
                 except Exception as e:
                     logger.error(f"Error sending automated email: {e}")
         
@@ -970,12 +989,12 @@ def get_transcript_for_call(call_record):
     
     if conv_id:
         try:
-            import requests
             import os
+            from .elevenlabs_client import http_session
             # Fetch conversation details from ElevenLabs
             url = f"https://api.elevenlabs.io/v1/convai/conversations/{conv_id}"
             headers = {"xi-api-key": os.getenv('ELEVENLABS_API_KEY')}
-            response = requests.get(url, headers=headers)
+            response = http_session().get(url, headers=headers, timeout=30)
             
             if response.ok:
                 data = response.json()
@@ -1045,9 +1064,9 @@ def fetch_and_store_conversation_task(call_record_id, conversation_id):
     Fetch conversation details from ElevenLabs and store in DB.
     """
     try:
-        import requests
         import os
         from django.conf import settings
+        from .elevenlabs_client import http_session
         
         call_record = CallRecord.objects.get(id=call_record_id)
         
@@ -1057,7 +1076,7 @@ def fetch_and_store_conversation_task(call_record_id, conversation_id):
             return
 
         url = f"https://api.elevenlabs.io/v1/convai/conversations/{conversation_id}"
-        resp = requests.get(url, headers={"xi-api-key": xi_key}, timeout=30)
+        resp = http_session().get(url, headers={"xi-api-key": xi_key}, timeout=30)
         
         if resp.status_code == 200:
             data = resp.json()
@@ -1146,7 +1165,7 @@ def fetch_and_store_conversation_task(call_record_id, conversation_id):
                 )
                 logger.info(f"Stored transcript for call {call_record_id}")
             
-            call_record.save()
+            call_record.save(update_fields=["status", "duration_seconds", "cost", "metadata"])
             logger.info(f"Updated CallRecord {call_record_id} with ElevenLabs data")
             
             # Trigger AI analysis if status is completed/done
@@ -1155,29 +1174,34 @@ def fetch_and_store_conversation_task(call_record_id, conversation_id):
                 
             # --- Fetch Audio Recording ---
             try:
-                audio_url = f"https://api.elevenlabs.io/v1/convai/conversations/{conversation_id}/audio"
-                audio_resp = requests.get(audio_url, headers={"xi-api-key": xi_key}, timeout=60)
+                import tempfile
+                from django.core.files import File
+                from django.core.files.storage import default_storage
                 
-                if audio_resp.status_code == 200:
-                    from django.core.files.base import ContentFile
-                    from django.core.files.storage import default_storage
-                    
-                    file_name = f"conversations/{conversation_id}.mp3"
-                    # Check if file already exists to avoid overwriting or duplication logic if needed
-                    if not default_storage.exists(file_name):
-                        file_path = default_storage.save(file_name, ContentFile(audio_resp.content))
-                        # Construct URL manually or use storage.url if available
-                        # explicit /media/ prefix as per settings.py MEDIA_URL
-                        call_record.recording_url = f"/media/{file_name}"
-                        call_record.save()
-                        logger.info(f"Saved audio recording to {call_record.recording_url}")
-                    else:
-                        # If existing, just ensure URL is set
-                        call_record.recording_url = f"/media/{file_name}"
-                        call_record.save()
-                        logger.info(f"Audio recording already exists at {file_name}")
+                file_name = f"conversations/{conversation_id}.mp3"
+                # explicit /media/ prefix as per settings.py MEDIA_URL
+                recording_url = f"/media/{file_name}"
+                
+                if default_storage.exists(file_name):
+                    # Already downloaded; just ensure URL is set
+                    call_record.recording_url = recording_url
+                    call_record.save(update_fields=["recording_url"])
+                    logger.info(f"Audio recording already exists at {file_name}")
                 else:
-                    logger.warning(f"Failed to fetch audio for {conversation_id}: {audio_resp.status_code}")
+                    audio_url = f"https://api.elevenlabs.io/v1/convai/conversations/{conversation_id}/audio"
+                    # Stream through a temp file so long recordings aren't held in worker memory
+                    with http_session().get(audio_url, headers={"xi-api-key": xi_key}, stream=True, timeout=60) as audio_resp:
+                        if audio_resp.status_code == 200:
+                            with tempfile.TemporaryFile() as tmp:
+                                for chunk in audio_resp.iter_content(chunk_size=64 * 1024):
+                                    tmp.write(chunk)
+                                tmp.seek(0)
+                                default_storage.save(file_name, File(tmp))
+                            call_record.recording_url = recording_url
+                            call_record.save(update_fields=["recording_url"])
+                            logger.info(f"Saved audio recording to {call_record.recording_url}")
+                        else:
+                            logger.warning(f"Failed to fetch audio for {conversation_id}: {audio_resp.status_code}")
             except Exception as e:
                 logger.error(f"Error fetching audio recording: {e}")
 
@@ -1302,7 +1326,7 @@ Return the extracted information in JSON format."""
             if not call_record.metadata:
                 call_record.metadata = {}
             call_record.metadata["llm_extraction"] = extracted_data
-            call_record.save()
+            call_record.save(update_fields=["metadata"])
             
             logger.info(f"LLM extraction completed for call {call_record_id}")
             return extracted_data
@@ -1334,11 +1358,11 @@ def sync_all_elevenlabs_conversations(hours_back=24):
     Returns:
         dict with sync results
     """
-    import requests
     import os
     from django.conf import settings
     from datetime import datetime, timedelta
     import time
+    from .elevenlabs_client import http_session
     
     xi_key = os.environ.get("ELEVENLABS_API_KEY") or getattr(settings, "ELEVENLABS_API_KEY", None)
     if not xi_key:
@@ -1363,7 +1387,7 @@ def sync_all_elevenlabs_conversations(hours_back=24):
     headers = {"xi-api-key": xi_key}
     
     try:
-        resp = requests.get(url, headers=headers, params=params, timeout=30)
+        resp = http_session().get(url, headers=headers, params=params, timeout=30)
         
         if resp.status_code != 200:
             error_msg = f"Failed to list ElevenLabs conversations: {resp.status_code} - {resp.text}"
@@ -1438,7 +1462,7 @@ def sync_all_elevenlabs_conversations(hours_back=24):
                     if not existing.metadata:
                         existing.metadata = {}
                     existing.metadata["conversation_id"] = conv_id
-                    existing.save()
+                    existing.save(update_fields=["external_call_id", "metadata"])
                 
                 # Fetch full conversation data
                 fetch_and_store_conversation_task(existing.id, conv_id)
@@ -1542,7 +1566,7 @@ def verify_document_task(document_id):
                 document.validation_status = "invalid"
                 document.status = "rejected"
                 
-            document.save()
+            document.save(update_fields=["extraction_data", "validation_status", "status"])
             logger.info(f"Document {document_id} verification complete: {document.validation_status}")
         else:
             logger.error(f"AI Verification failed: {result.get('error')}")
@@ -1585,7 +1609,7 @@ def calculate_follow_up_time(timing_str):
         return now + timedelta(days=2)
 
 
-@shared_task
+@shared_task(rate_limit=WHATSAPP_SEND_RATE_LIMIT)
 def send_ai_post_call_whatsapp_task(call_record_id):
     """
     Send an AI-generated WhatsApp message after a call completes.
@@ -1597,83 +1621,96 @@ def send_ai_post_call_whatsapp_task(call_record_id):
     3. Send via WhatsApp API using post_call_followup template
     4. Log to WhatsAppMessage model
     """
-    logger.info(f"[WHATSAPP-AI] ===== TASK STARTED for call_record_id={call_record_id} =====")
+    logger.info("[WHATSAPP-AI] ===== TASK STARTED for call_record_id=%s =====", call_record_id)
     
     try:
         from .models import CallRecord, WhatsAppMessage
         from .services.whatsapp_ai_assistant import WhatsAppAssistant
         from .services.whatsapp_client import send_template_message
         
-        # Get CallRecord
-        call = CallRecord.objects.get(id=call_record_id)
-        logger.info(f"[WHATSAPP-AI] Found CallRecord {call.id}, status={call.status}")
+        # Get CallRecord with its lead; the message log only needs the lead's tenant_id
+        call = CallRecord.objects.select_related('lead').get(id=call_record_id)
+        logger.info("[WHATSAPP-AI] Found CallRecord %s, status=%s", call.id, call.status)
         
         # Get Lead target
         lead = call.lead
         if not lead:
-            logger.warning(f"[WHATSAPP-AI] No lead for call {call_record_id}")
+            logger.warning("[WHATSAPP-AI] No lead for call %s", call_record_id)
             return
         if not lead.phone:
-            logger.warning(f"[WHATSAPP-AI] Lead {lead.id} ({lead.name}) has no phone number")
+            logger.warning("[WHATSAPP-AI] Lead %s (%s) has no phone number", lead.id, lead.name)
             return
         
-        logger.info(f"[WHATSAPP-AI] Lead: {lead.name}, phone: {lead.phone}")
+        logger.info("[WHATSAPP-AI] Lead: %s, phone: %s", lead.name, lead.phone)
         
-        # Generate message using AI
-        assistant = WhatsAppAssistant()
-        result = assistant.generate_post_call_message(call, lead)
-        
-        if not result.get("success"):
-            logger.warning(f"[WHATSAPP-AI] Message generation failed, using fallback: {result.get('error')}")
-        
-        message_text = result.get("message", "Thanks for chatting with us! 🎓")
-        
-        # Send via WhatsApp using post_call_followup template
-        # Note: Template parameters would need to be configured based on Meta template structure
-        send_result = send_template_message(
-            lead.phone, 
-            "post_call_followup",
-            language_code="en",
-            components=[
-                {
-                    "type": "body",
-                    "parameters": [
-                        {"type": "text", "text": lead.name or "Student"},
-                        {"type": "text", "text": message_text}
-                    ]
+        guard_key = _claim_post_call_send(call_record_id, "ai_post_call")
+        if not guard_key:
+            logger.info("[WHATSAPP-AI] Post-call message for call %s already sent", call_record_id)
+            return
+
+        # Keep the claim only once the message has actually gone out; any
+        # failure or exception below releases it so a retry can send.
+        sent = False
+        try:
+            # Generate message using AI
+            assistant = WhatsAppAssistant()
+            result = assistant.generate_post_call_message(call, lead)
+        
+            if not result.get("success"):
+                logger.warning("[WHATSAPP-AI] Message generation failed, using fallback: %s", result.get('error'))
+        
+            message_text = result.get("message", "Thanks for chatting with us! 🎓")
+        
+            # Send via WhatsApp using post_call_followup template
+            # Note: Template parameters would need to be configured based on Meta template structure
+            send_result = send_template_message(
+                lead.phone, 
+                "post_call_followup",
+                language_code="en",
+                components=[
+                    {
+                        "type": "body",
+                        "parameters": [
+                            {"type": "text", "text": lead.name or "Student"},
+                            {"type": "text", "text": message_text}
+                        ]
+                    }
+                ]
+            )
+            sent = bool(send_result.get("success"))
+        
+            # Log to WhatsAppMessage
+            WhatsAppMessage.objects.create(
+                lead=lead,
+                tenant_id=lead.tenant_id,
+                direction="outbound",
+                message_type="template",
+                template_name="post_call_followup",
+                from_phone=settings.WHATSAPP_PHONE_NUMBER_ID or "",
+                to_phone=lead.phone,
+                message_body=message_text,
+                message_id=send_result.get("message_id"),
+                status="sent" if send_result.get("success") else "failed",
+                error_message=send_result.get("error") if not send_result.get("success") else None,
+                metadata={
+                    "call_record_id": call_record_id,
+                    "ai_generated": True,
+                    "send_result": send_result
                 }
-            ]
-        )
-        
-        # Log to WhatsAppMessage
-        WhatsAppMessage.objects.create(
-            lead=lead,
-            tenant=lead.tenant,
-            direction="outbound",
-            message_type="template",
-            template_name="post_call_followup",
-            from_phone=settings.WHATSAPP_PHONE_NUMBER_ID or "",
-            to_phone=lead.phone,
-            message_body=message_text,
-            message_id=send_result.get("message_id"),
-            status="sent" if send_result.get("success") else "failed",
-            error_message=send_result.get("error") if not send_result.get("success") else None,
-            metadata={
-                "call_record_id": call_record_id,
-                "ai_generated": True,
-                "send_result": send_result
-            }
-        )
+            )
         
-        if send_result.get("success"):
-            logger.info(f"[WHATSAPP-AI] Post-call message sent to {lead.phone} (Call {call_record_id})")
-        else:
-            logger.error(f"[WHATSAPP-AI] Failed to send message: {send_result.get('error')}")
-            
+            if send_result.get("success"):
+                logger.info("[WHATSAPP-AI] Post-call message sent to %s (Call %s)", lead.phone, call_record_id)
+            else:
+                logger.error("[WHATSAPP-AI] Failed to send message: %s", send_result.get('error'))
+        finally:
+            if not sent:
+                cache.delete(guard_key)
+
     except CallRecord.DoesNotExist:
-        logger.error(f"[WHATSAPP-AI] CallRecord {call_record_id} not found")
+        logger.error("[WHATSAPP-AI] CallRecord %s not found", call_record_id)
     except Exception as e:
-        logger.exception(f"[WHATSAPP-AI] Error in send_ai_post_call_whatsapp_task: {e}")
+        logger.exception("[WHATSAPP-AI] Error in send_ai_post_call_whatsapp_task: %s", e)
 
 
 @shared_task
@@ -1697,25 +1734,29 @@ def handle_incoming_whatsapp_with_ai_task(whatsapp_message_id):
         from .services.whatsapp_client import send_text_message
         
         # Get incoming message
-        incoming_msg = WhatsAppMessage.objects.get(id=whatsapp_message_id)
+        incoming_msg = WhatsAppMessage.objects.select_related('lead__tenant').get(id=whatsapp_message_id)
         
         if incoming_msg.direction != "inbound":
-            logger.warning(f"[WHATSAPP-AI] Message {whatsapp_message_id} is not inbound")
+            logger.warning("[WHATSAPP-AI] Message %s is not inbound", whatsapp_message_id)
             return
         
         # Get Lead target
         lead = incoming_msg.lead
         if not lead:
-            logger.warning(f"[WHATSAPP-AI] No lead found for message {whatsapp_message_id}")
+            logger.warning("[WHATSAPP-AI] No lead found for message %s", whatsapp_message_id)
             return
         
         # Handle empty message body
         message_text = incoming_msg.message_body or ""
-        logger.info(f"[WHATSAPP-AI] Processing incoming message from {lead.name}: {message_text[:50]}...")
+        logger.info("[WHATSAPP-AI] Processing incoming message from %s: %s...", lead.name, message_text[:50])
         
         # Get conversation history (last 10 messages for this lead)
         conversation_history = []
-        messages = WhatsAppMessage.objects.filter(lead=lead).order_by('-created_at')[:10]
+        messages = (
+            WhatsAppMessage.objects.filter(lead=lead)
+            .only('id', 'direction', 'message_body')
+            .order_by('-created_at')[:10]
+        )
         
         for msg in reversed(messages):
             if msg.id != whatsapp_message_id:  # Exclude current message
@@ -1727,19 +1768,21 @@ def handle_incoming_whatsapp_with_ai_task(whatsapp_message_id):
         # Get call context from most recent call
         call_context = {}
         try:
-            recent_call = CallRecord.objects.filter(lead=lead).order_by('-created_at').first()
+            # Only metadata is read; skip the analysis/transcript JSON columns
+            recent_call = CallRecord.objects.filter(lead=lead).only('metadata').order_by('-created_at').first()
             
-            if recent_call and recent_call.metadata:
-                ai_analysis = recent_call.metadata.get('ai_analysis_result', {})
+            call_meta = recent_call.metadata if recent_call else None
+            if call_meta:
+                ai_analysis = call_meta.get('ai_analysis_result', {})
                 call_context = {
-                    "country": recent_call.metadata.get('country') or lead.country,
-                    "program_interest": recent_call.metadata.get('program_interest'),
-                    "document_status": recent_call.metadata.get('document_status'),
+                    "country": call_meta.get('country') or lead.country,
+                    "program_interest": call_meta.get('program_interest'),
+                    "document_status": call_meta.get('document_status'),
                     "discussion_points": ai_analysis.get('key_discussion_points', []) if isinstance(ai_analysis, dict) else [],
-                    "pending_followups": recent_call.metadata.get('pending_tasks', []),
+                    "pending_followups": call_meta.get('pending_tasks', []),
                 }
         except Exception as e:
-            logger.debug(f"[WHATSAPP-AI] Could not fetch call context: {e}")
+            logger.debug("[WHATSAPP-AI] Could not fetch call context: %s", e)
         
         # Generate AI reply
         assistant = WhatsAppAssistant()
@@ -1751,7 +1794,7 @@ def handle_incoming_whatsapp_with_ai_task(whatsapp_message_id):
         )
         
         if not reply_result.get("success"):
-            logger.warning(f"[WHATSAPP-AI] Reply generation failed: {reply_result.get('error')}")
+            logger.warning("[WHATSAPP-AI] Reply generation failed: %s", reply_result.get('error'))
         
         reply_text = reply_result.get("reply", "Thanks for reaching out! Our team will get back to you shortly. 😊")
         requires_escalation = reply_result.get("requires_escalation", False)
@@ -1779,7 +1822,7 @@ def handle_incoming_whatsapp_with_ai_task(whatsapp_message_id):
             }
         )
         
-        logger.info(f"[WHATSAPP-AI] Reply sent to {lead.phone} - Escalation: {requires_escalation}")
+        logger.info("[WHATSAPP-AI] Reply sent to %s - Escalation: %s", lead.phone, requires_escalation)
         
         # If escalation needed, create staff notification task
         if requires_escalation:
@@ -1797,11 +1840,11 @@ def handle_incoming_whatsapp_with_ai_task(whatsapp_message_id):
                         "reply_message_id": reply_msg.id
                     }
                 )
-                logger.info(f"[WHATSAPP-AI] Created escalation task for {lead.name}")
+                logger.info("[WHATSAPP-AI] Created escalation task for %s", lead.name)
             except Exception as e:
-                logger.error(f"[WHATSAPP-AI] Failed to create escalation task: {e}")
+                logger.error("[WHATSAPP-AI] Failed to create escalation task: %s", e)
         
     except WhatsAppMessage.DoesNotExist:
-        logger.error(f"[WHATSAPP-AI] WhatsAppMessage {whatsapp_message_id} not found")
+        logger.error("[WHATSAPP-AI] WhatsAppMessage %s not found", whatsapp_message_id)
     except Exception as e:
-        logger.exception(f"[WHATSAPP-AI] Error in handle_incoming_whatsapp_with_ai_task: {e}")
\ No newline at end of file
+        logger.exception("[WHATSAPP-AI] Error in handle_incoming_whatsapp_with_ai_task: %s", e)
\ No newline at end of file
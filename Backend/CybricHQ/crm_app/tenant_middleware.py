@@ -3,10 +3,88 @@ Tenant middleware for multi-tenant white-label support.
 Automatically detects and sets the current tenant on each request.
 """
 import logging
+import time
+from functools import lru_cache
+from django.conf import settings
+from django.core.cache import cache
 from django.utils.deprecation import MiddlewareMixin
 
 logger = logging.getLogger(__name__)
 
+# Domain/subdomain -> tenant lookups run on every request but change rarely
+TENANT_LOOKUP_CACHE_TIMEOUT = 300
+_NO_TENANT = 0  # cached "no match", since a None from the cache means a miss
+
+# Paths that never need a tenant: admin, static/media files and probes
+TENANT_BYPASS_PREFIXES = tuple(getattr(settings, 'TENANT_BYPASS_PREFIXES', (
+    '/admin/', '/static/', '/media/', '/favicon.ico', '/health/', '/ping/', '/api/v1/health/',
+)))
+
+
+def _cached_lookup(key, lookup):
+    tenant = cache.get(key)
+    if tenant is None:
+        tenant = lookup() or _NO_TENANT
+        cache.set(key, tenant, TENANT_LOOKUP_CACHE_TIMEOUT)
+    return tenant or None
+
+
+def tenant_for_domain(host):
+    """Active tenant whose TenantSettings.custom_domain is `host`, if any."""
+    from crm_app.models import TenantSettings
+
+    def lookup():
+        settings_obj = TenantSettings.objects.select_related('tenant').filter(
+            custom_domain=host,
+            tenant__is_active=True
+        ).first()
+        return settings_obj.tenant if settings_obj else None
+
+    return _cached_lookup(f"tenant:domain:{host}", lookup)
+
+
+def tenant_for_slug(slug):
+    """Active tenant with the given slug, if any."""
+    from crm_app.models import Tenant
+    return _cached_lookup(
+        f"tenant:slug:{slug}",
+        lambda: Tenant.objects.filter(slug=slug, is_active=True).first(),
+    )
+
+
+@lru_cache(maxsize=1024)
+def _access_token_claims(token):
+    """
+    (user_id, exp) of a verified access-token cookie. Tokens are immutable,
+    so a browser's repeated requests verify its cookie once per process;
+    callers still check exp. Invalid tokens raise and are not cached.
+    """
+    from rest_framework_simplejwt.tokens import AccessToken
+    access = AccessToken(token)
+    return access.get("user_id"), access["exp"]
+
+
+def tenant_for_user(user_id):
+    """Tenant assigned on the user's profile, if any."""
+    from crm_app.models import UserProfile
+
+    def lookup():
+        # Use explicit query instead of reverse relation to avoid DoesNotExist
+        profile = UserProfile.objects.select_related('tenant').filter(user_id=user_id).first()
+        return profile.tenant if profile else None
+
+    return _cached_lookup(f"tenant:user:{user_id}", lookup)
+
+
+def invalidate_tenant_lookups(slug=None, domain=None, user_ids=()):
+    keys = [f"tenant:user:{user_id}" for user_id in user_ids]
+    if slug:
+        keys.append(f"tenant:slug:{slug}")
+    if domain:
+        keys.append(f"tenant:domain:{domain}")
+    if keys:
+        cache.delete_many(keys)
+
 
 class TenantMiddleware(MiddlewareMixin):
     """
@@ -20,29 +98,22 @@ class TenantMiddleware(MiddlewareMixin):
     
     def process_request(self, request):
         try:
-            # Import here to avoid circular imports
-            from crm_app.models import TenantSettings, Tenant, UserProfile
-            
-            tenant = None
-            host = request.get_host().split(':')[0]  # Remove port if present
-            
-            # Skip tenant resolution for admin panel and health checks
+            # Skip tenant resolution before any lookups for paths that don't need one
             path = request.path
-            if path.startswith('/admin/') or path in ['/health/', '/ping/']:
+            if path.startswith(TENANT_BYPASS_PREFIXES):
                 request.tenant = None
                 return None
             
+            tenant = None
+            host = request.get_host().split(':')[0]  # Remove port if present
+            
             # 1. Try custom domain match first (highest priority)
             try:
-                settings_obj = TenantSettings.objects.select_related('tenant').filter(
-                    custom_domain=host,
-                    tenant__is_active=True
-                ).first()
-                if settings_obj:
-                    tenant = settings_obj.tenant
-                    logger.info(f"✓ Resolved tenant from custom domain {host}: {tenant.slug}")
+                tenant = tenant_for_domain(host)
+                if tenant:
+                    logger.debug("Resolved tenant from custom domain %s: %s", host, tenant.slug)
             except Exception as e:
-                logger.debug(f"Custom domain lookup failed: {e}")
+                logger.debug("Custom domain lookup failed: %s", e)
             
             # 2. Try subdomain pattern (e.g., tenant-slug.cybrikhq.com)
             if not tenant:
@@ -54,65 +125,53 @@ class TenantMiddleware(MiddlewareMixin):
                     # Skip if it's common non-tenant subdomains
                     if potential_slug not in ['www', 'api', 'admin', 'localhost', '127', 'crm']:
                         try:
-                            tenant = Tenant.objects.filter(
-                                slug=potential_slug,
-                                is_active=True
-                            ).first()
+                            tenant = tenant_for_slug(potential_slug)
                             if tenant:
-                                logger.info(f"✓ Resolved tenant from subdomain: {tenant.slug}")
+                                logger.debug("Resolved tenant from subdomain: %s", tenant.slug)
                         except Exception as e:
-                            logger.debug(f"Subdomain lookup failed: {e}")
+                            logger.debug("Subdomain lookup failed: %s", e)
             
             # 3. Try from authenticated user's profile (important for API calls)
             if not tenant:
-                user = request.user
+                user_id = request.user.pk if request.user.is_authenticated else None
                 
-                # Fallback: If not authenticated via session/headers, try JWT cookie
-                if not user.is_authenticated:
+                # Fallback: If not authenticated via session/headers, try JWT cookie.
+                # Only the id is needed; the profile query below does the lookup.
+                if user_id is None:
                     try:
-                        from django.conf import settings
-                        from rest_framework_simplejwt.tokens import AccessToken
-                        from django.contrib.auth import get_user_model
-    
                         cookie_name = getattr(settings, "ACCESS_COOKIE_NAME", "cyb_access_v2")
                         token = request.COOKIES.get(cookie_name) or request.COOKIES.get("cyb_access")
                         
                         if token:
-                            access = AccessToken(token)
-                            user_id = access.get("user_id")
-                            User = get_user_model()
-                            user = User.objects.get(pk=user_id)
-                            logger.debug(f"Resolved user from JWT: {user.username}")
+                            token_user_id, exp = _access_token_claims(token)
+                            if exp > time.time():
+                                user_id = token_user_id
+                                logger.debug("Resolved user from JWT: %s", user_id)
                     except Exception as e:
-                        logger.debug(f"JWT decode failed: {e}")
+                        logger.debug("JWT decode failed: %s", e)
     
                 # Get tenant from user's profile
-                if user and user.is_authenticated:
+                if user_id is not None:
                     try:
-                        # Use explicit query instead of reverse relation to avoid DoesNotExist
-                        profile = UserProfile.objects.select_related('tenant').filter(
-                            user=user
-                        ).first()
-                        
-                        if profile and profile.tenant:
-                            tenant = profile.tenant
-                            logger.info(f"✓ Resolved tenant from user {user.username}'s profile: {tenant.slug}")
+                        tenant = tenant_for_user(user_id)
+                        if tenant:
+                            logger.debug("Resolved tenant from user %s's profile: %s", user_id, tenant.slug)
                         else:
-                            logger.debug(f"User {user.username} has no profile or no tenant assigned")
+                            logger.debug("User %s has no profile or no tenant assigned", user_id)
                     except Exception as e:
-                        logger.warning(f"Profile tenant lookup failed for user {user.username}: {e}")
+                        logger.warning("Profile tenant lookup failed for user %s: %s", user_id, e)
             
             # Set tenant on request for downstream use
             request.tenant = tenant
             
-            # Security: Log tenant resolution for audit
+            # Runs on every request: keep it at DEBUG and let logging skip the formatting
             if tenant:
-                logger.info(f"[TENANT-RESOLVED] host={host} → tenant={tenant.slug} (id={tenant.id})")
+                logger.debug("[TENANT-RESOLVED] host=%s -> tenant=%s (id=%s)", host, tenant.slug, tenant.id)
             else:
-                logger.warning(f"[NO-TENANT] host={host}, path={path}, user={request.user if request.user.is_authenticated else 'anonymous'}")
+                logger.debug("[NO-TENANT] host=%s, path=%s, user=%s", host, path, request.user)
 
         except Exception as e:
-            logger.error(f"CRITICAL: TenantMiddleware crashed: {e}")
+            logger.error("CRITICAL: TenantMiddleware crashed: %s", e)
             request.tenant = None # Safe fallback
         
         return None  # Continue processing
@@ -0,0 +1,18 @@
+from rest_framework.throttling import SimpleRateThrottle
+
+
+class WhatsAppSendThrottle(SimpleRateThrottle):
+    """
+    Caps outbound WhatsApp sends per recipient lead, whoever triggers them.
+    Every send is a billed Meta conversation, so repeated clicks or a script
+    hammering one number shouldn't turn into unbounded spend. DRF keeps the
+    request history per key in the cache, i.e. a sliding window.
+    """
+    scope = 'whatsapp_send'
+    rate = '10/hour'
+
+    def get_cache_key(self, request, view):
+        lead_id = request.data.get('lead_id')
+        if not lead_id:
+            return None  # the view rejects the request anyway
+        return self.cache_format % {'scope': self.scope, 'ident': lead_id}
@@ -0,0 +1,10 @@
+from django.urls import path
+
+from . import views
+
+urlpatterns = [
+    path("schedule/", views.ScheduleAICallView.as_view(), name="schedule-ai-call"),
+    path("trigger/", views.TriggerAICallNowView.as_view(), name="trigger-ai-call"),
+    path("process-due/", views.ProcessDueAICallsView.as_view(), name="process-due-ai-calls"),
+    path("sync-elevenlabs/", views.SyncElevenLabsCallsView.as_view(), name="sync-elevenlabs-calls"),
+]
@@ -0,0 +1,11 @@
+from django.urls import path
+
+from . import views_analytics
+
+urlpatterns = [
+    path("time-series/", views_analytics.analytics_time_series, name="analytics-time-series"),
+    path("funnel/", views_analytics.analytics_funnel, name="analytics-funnel"),
+    path("applications-status/", views_analytics.analytics_applications_status, name="analytics-applications-status"),
+    path("cost-time-series/", views_analytics.analytics_cost_time_series, name="analytics-cost-time-series"),
+    path("llm-usage/", views_analytics.analytics_llm_usage, name="analytics-llm-usage"),
+]
@@ -0,0 +1,15 @@
+from django.urls import path
+
+from . import auth_views
+
+urlpatterns = [
+    path("login/", auth_views.login_view, name="api_login"),
+    path("login", auth_views.login_view, name="api_login_noslash"),
+    path("refresh/", auth_views.refresh_view, name="api_refresh"),
+    path("refresh", auth_views.refresh_view, name="api_refresh_noslash"),
+    path("logout/", auth_views.logout_view, name="api_logout"),
+    path("logout", auth_views.logout_view, name="api_logout_noslash"),
+    path("me/", auth_views.me_view, name="api_me"),
+    path("me", auth_views.me_view, name="api_me_noslash"),
+    path("change-password/", auth_views.change_password_view, name="api_change_password"),
+]
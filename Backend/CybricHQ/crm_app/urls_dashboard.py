@@ -0,0 +1,12 @@
+from django.urls import path
+
+from . import views_dashboard
+
+urlpatterns = [
+    path("overview/", views_dashboard.dashboard_overview, name="dashboard-overview"),
+    path("country-stats/", views_dashboard.country_wise_stats, name="dashboard-country-stats"),
+    path("config/", views_dashboard.get_dashboard_config, name="get-dashboard-config"),
+    path("config/save/", views_dashboard.save_dashboard_config, name="save-dashboard-config"),
+    path("config/save-role/", views_dashboard.save_role_config, name="save-role-config"),
+    path("config/get-role/", views_dashboard.get_role_config, name="get-role-config"),
+]
@@ -0,0 +1,12 @@
+from django.urls import path
+
+from . import views_elevenlabs
+from .views import ElevenLabsWebhookView
+
+urlpatterns = [
+    # Single, canonical webhook / callback endpoint.
+    # Ensure ELEVENLABS_POSTCALL_WEBHOOK in settings points to this route.
+    path("callback/", ElevenLabsWebhookView.as_view(), name="elevenlabs_callback"),
+    path("postcall/", views_elevenlabs.elevenlabs_postcall, name="elevenlabs-postcall"),
+    path("audio/<str:conversation_id>/", views_elevenlabs.ElevenLabsAudioProxy.as_view(), name="elevenlabs-audio-proxy"),
+]
@@ -0,0 +1,11 @@
+from django.urls import path
+
+from . import smartflo_api
+
+urlpatterns = [
+    path("call/initiate/", smartflo_api.initiate_ai_call, name="smartflo-initiate-call"),
+    path("call/end/", smartflo_api.end_call, name="smartflo-end-call"),
+    path("call/<str:call_sid>/status/", smartflo_api.get_call_status, name="smartflo-call-status"),
+    path("dialplan/", smartflo_api.dialplan_webhook, name="smartflo-dialplan"),
+    path("dialplan", smartflo_api.dialplan_webhook, name="smartflo-dialplan-noslash"),
+]
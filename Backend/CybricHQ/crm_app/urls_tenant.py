@@ -0,0 +1,17 @@
+from django.urls import path
+
+from . import views_tenant
+from .views_usage import tenant_usage_dashboard, tenant_usage_history, tenant_usage_logs
+
+urlpatterns = [
+    # White-label
+    path("branding/", views_tenant.get_tenant_branding, name="tenant-branding"),
+    path("settings/", views_tenant.tenant_settings, name="tenant-settings"),
+    path("current/", views_tenant.current_tenant, name="current-tenant"),
+    path("usage/", views_tenant.tenant_usage, name="tenant-usage"),
+
+    # Usage tracking
+    path("usage/dashboard/", tenant_usage_dashboard, name="tenant-usage-dashboard"),
+    path("usage/history/", tenant_usage_history, name="tenant-usage-history"),
+    path("usage/logs/", tenant_usage_logs, name="tenant-usage-logs"),
+]
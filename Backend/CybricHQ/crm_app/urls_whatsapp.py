@@ -0,0 +1,10 @@
+from django.urls import path
+
+from . import views_whatsapp
+
+urlpatterns = [
+    path("webhook/", views_whatsapp.whatsapp_webhook, name="whatsapp-webhook"),
+    path("send/", views_whatsapp.send_whatsapp_message, name="whatsapp-send"),
+    path("send-document-request/", views_whatsapp.send_document_upload_request, name="whatsapp-document-request"),
+    path("config-status/", views_whatsapp.whatsapp_config_status, name="whatsapp-config-status"),
+]
@@ -376,7 +376,8 @@ class TranscriptViewSet(viewsets.ModelViewSet):
 
 
 class AIResultViewSet(viewsets.ModelViewSet):
-    queryset = AIResult.objects.all().order_by("-created_at")
+    # AIResultSerializer.get_transcript reads call.transcripts for every row
+    queryset = AIResult.objects.select_related("call").prefetch_related("call__transcripts").order_by("-created_at")
     serializer_class = AIResultSerializer
     permission_classes = [IsAuthenticated]
     filterset_fields = ("application",)
@@ -532,8 +533,7 @@ class LeadViewSet(TenantQuerySetMixin, viewsets.ModelViewSet):
         # Check if status changed to 'converted'
         if lead.status == 'converted' and old_status != 'converted':
             # Check if an Application already exists for this lead
-            existing_app = Application.objects.filter(lead=lead).first()
-            if not existing_app:
+            if not Application.objects.filter(lead=lead).exists():
                 # Create a new Application for this converted lead
                 # Use raw SQL because production DB has extra NOT NULL fields not in Django model
                 from django.db import connection
@@ -934,7 +934,12 @@ class CallRecordViewSet(TenantQuerySetMixin, viewsets.ModelViewSet):
             applicant_id = applicant_id.strip("/")
             qs = qs.filter(applicant_id=applicant_id)
             
-        return qs
+        # ai_analysis_result is not part of CallRecordSerializer; skip the JSON blob
+        return (
+            qs.select_related("lead", "application")
+            .prefetch_related("transcripts")
+            .defer("ai_analysis_result")
+        )
 
     @action(detail=False, methods=["post"])
     def bulk_delete(self, request):
@@ -1024,7 +1029,7 @@ class FollowUpViewSet(TenantQuerySetMixin, viewsets.ModelViewSet):
         2. Add AI-powered task analysis and auto-scheduling
         3. Generate comprehensive call context for ElevenLabs
         """
-        from .services.ai_task_scheduler import ai_scheduler
+        from .services.ai_task_scheduler import get_ai_scheduler
         from .services.followup_generator import followup_generator
         from rest_framework import status as http_status
         from django.utils import timezone
@@ -1045,7 +1050,7 @@ class FollowUpViewSet(TenantQuerySetMixin, viewsets.ModelViewSet):
             ai_actions.append("Set to AI call channel for automated follow-up")
         
         if notes and auto_analyze:
-            analysis = ai_scheduler.analyze_task(notes, None, channel)
+            analysis = get_ai_scheduler().analyze_task(notes, None, channel)
             
             if analysis['auto_schedule_at'] and not due_at:
                 data['due_at'] = analysis['auto_schedule_at'].isoformat()
@@ -1111,7 +1116,7 @@ class FollowUpViewSet(TenantQuerySetMixin, viewsets.ModelViewSet):
         """
         from .tasks import trigger_scheduled_ai_call
         from django.utils.dateparse import parse_datetime
-        from .services.ai_task_scheduler import ai_scheduler
+        from .services.ai_task_scheduler import get_ai_scheduler
         
         task = self.get_object()
         old_data = {
@@ -1175,7 +1180,7 @@ class FollowUpViewSet(TenantQuerySetMixin, viewsets.ModelViewSet):
             actions_taken.append("Notes updated")
             
             if auto_analyze and new_notes:
-                notes_analysis = ai_scheduler.analyze_task(new_notes, task.due_at, task.channel)
+                notes_analysis = get_ai_scheduler().analyze_task(new_notes, task.due_at, task.channel)
                 ai_analysis.append({
                     "change": "notes_analyzed",
                     "requires_call": notes_analysis['requires_call'],
@@ -1982,7 +1987,7 @@ class ElevenLabsPostcallWebhook(APIView):
         # Update call status to completed / or keep initiated if still ongoing
         try:
             call.status = "completed" if payload.get("call_status") in ("completed", "ended", "hangup") or payload.get("success") else call.status
-            call.save()
+            call.save(update_fields=["status", "recording_url", "metadata"])
         except Exception:
             logger.exception("Failed to update CallRecord %s", getattr(call, "id", None))
 
@@ -2177,7 +2182,7 @@ class ElevenLabsPostcallWebhook(APIView):
         # Update call status to completed / or keep initiated if still ongoing
         try:
             call.status = "completed" if payload.get("call_status") in ("completed", "ended", "hangup") or payload.get("success") else call.status
-            call.save()
+            call.save(update_fields=["status", "recording_url", "metadata"])
         except Exception:
             logger.exception("Failed to update CallRecord %s", getattr(call, "id", None))
 
@@ -11,6 +11,7 @@ from django.http import JsonResponse, HttpResponseBadRequest, HttpResponseForbid
 from django.utils import timezone
 from django.views.decorators.csrf import csrf_exempt
 
+from .elevenlabs_client import http_session
 from .models import CallRecord, Transcript
 
 logger = logging.getLogger(__name__)
@@ -350,15 +351,13 @@ def elevenlabs_postcall(request):
                         inner_meta.get("from")
                     )
                 
-                # Try to find applicant or lead by phone if we have one
+                # Try to find the lead by phone if we have one (only its id is needed for the FK)
                 if phone_number:
                     try:
-                        from .models import Applicant, Lead
-                        applicant_obj = Applicant.objects.filter(phone=phone_number).first()
-                        if not applicant_obj:
-                            lead_obj = Lead.objects.filter(phone=phone_number).first()
+                        from .models import Lead
+                        lead_obj = Lead.objects.by_phone(phone_number).only("id").first()
                     except Exception:
-                        logger.exception("Failed to lookup applicant/lead by phone")
+                        logger.exception("Failed to lookup lead by phone")
             
             # Ensure phone is in metadata for easy access
             call_metadata = payload or {}
@@ -368,7 +367,6 @@ def elevenlabs_postcall(request):
             call_record = CallRecord.objects.create(
                 provider="elevenlabs", 
                 external_call_id=callSid or None, 
-                applicant=applicant_obj,
                 lead=lead_obj,
                 metadata=call_metadata
             )
@@ -423,7 +421,7 @@ def elevenlabs_postcall(request):
                 logger.warning("ELEVENLABS_API_KEY not configured; cannot fetch conversation %s", conversation_id)
             else:
                 url = f"https://api.elevenlabs.io/v1/convai/conversations/{conversation_id}"
-                resp = requests.get(url, headers={"xi-api-key": xi_key}, timeout=15)
+                resp = http_session().get(url, headers={"xi-api-key": xi_key}, timeout=15)
                 if resp.status_code == 200:
                     conv_data = resp.json()
                     store_conversation_data(call_record, conv_data)
@@ -171,7 +171,11 @@ class AdCampaignViewSet(viewsets.ReadOnlyModelViewSet):
         if status_filter:
             queryset = queryset.filter(status=status_filter)
         
-        return queryset.select_related('integration')
+        if self.action == 'list':
+            queryset = queryset.order_by('-total_spend')
+        
+        # raw_data (full API payload) is never serialized
+        return queryset.select_related('integration').defer('raw_data')
 
     @action(detail=False, methods=['get'])
     def summary(self, request):
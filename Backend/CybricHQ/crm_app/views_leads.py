@@ -26,7 +26,7 @@ class PortalLeadView(views.APIView):
         # Deduplication Logic
         existing_lead = None
         if phone:
-            existing_lead = Lead.objects.filter(phone=phone, status__in=["NEW", "CONTACTED_INCOMPLETE"]).first()
+            existing_lead = Lead.objects.by_phone(phone).filter(status__in=["NEW", "CONTACTED_INCOMPLETE"]).first()
         if not existing_lead and email:
             existing_lead = Lead.objects.filter(email=email, status__in=["NEW", "CONTACTED_INCOMPLETE"]).first()
             
@@ -64,7 +64,7 @@ class WalkInLeadView(views.APIView):
         # Deduplication Logic
         existing_lead = None
         if phone:
-            existing_lead = Lead.objects.filter(phone=phone).first()
+            existing_lead = Lead.objects.by_phone(phone).first()
         
         if existing_lead:
              # For walk-ins, we might want to create a new visit log or just update the lead
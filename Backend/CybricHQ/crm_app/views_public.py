@@ -122,9 +122,11 @@ class PublicUploadView(views.APIView):
             return error_response
         
         try:
-            lead = Lead.objects.get(pk=lead_id)
-            logger.info(f"Lead found: {lead.id} - {str(lead)}")
-            return Response({"valid": True, "lead_name": str(lead), "lead_id": lead.id})
+            # The portal polls this endpoint; only the fields Lead.__str__ needs are loaded
+            lead = Lead.objects.only("id", "first_name", "last_name", "name").get(pk=lead_id)
+            lead_name = str(lead)
+            logger.info("Lead found: %s - %s", lead.id, lead_name)
+            return Response({"valid": True, "lead_name": lead_name, "lead_id": lead.id})
         except Lead.DoesNotExist:
             logger.error(f"Lead not found for id: {lead_id}")
             return Response({"error": "Lead not found."}, status=status.HTTP_404_NOT_FOUND)
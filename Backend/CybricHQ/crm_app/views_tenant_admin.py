@@ -212,6 +212,18 @@ class TenantViewSet(viewsets.ModelViewSet):
     queryset = Tenant.objects.all().order_by('-created_at')
     permission_classes = [IsAuthenticated]  # TODO: Add IsAdminUser for production
     
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action == 'list':
+            # The list only shows a handful of tenant columns plus the company
+            # name; skip the API keys and JSON configs on TenantSettings.
+            return queryset.select_related('settings').only(
+                'id', 'name', 'slug', 'is_active', 'created_at', 'settings__company_name'
+            )
+        if self.action == 'retrieve':
+            return queryset.select_related('settings')
+        return queryset
+    
     def get_serializer_class(self):
         if self.action == 'list':
             return TenantListSerializer
@@ -3,14 +3,17 @@
 WhatsApp Business API views for webhooks and sending messages.
 """
 import logging
-from rest_framework.decorators import api_view, permission_classes
+import ujson
+from rest_framework.decorators import api_view, permission_classes, throttle_classes
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework.response import Response
 from rest_framework import status
 from django.conf import settings
 from django.http import HttpResponse
+from django.utils import timezone
 
 from .models import Lead, WhatsAppMessage
+from .throttles import WhatsAppSendThrottle
 from .services.whatsapp_client import (
     send_template_message,
     send_text_message,
@@ -46,8 +49,9 @@ def whatsapp_webhook(request):
     
     # POST - incoming message or status update
     try:
-        payload = request.data
-        logger.info(f"WhatsApp webhook received: {payload}")
+        # Parse the raw body directly rather than through DRF's stdlib-json parser
+        payload = ujson.loads(request.body)
+        logger.info("WhatsApp webhook received: %s", payload)
         
         parsed = parse_webhook_message(payload)
         if not parsed:
@@ -63,7 +67,7 @@ def whatsapp_webhook(request):
         return Response({"status": "ok"})
         
     except Exception as e:
-        logger.exception(f"WhatsApp webhook error: {e}")
+        logger.exception("WhatsApp webhook error: %s", e)
         # Always return 200 to Meta to avoid retries
         return Response({"status": "error", "message": str(e)})
 
@@ -74,16 +78,22 @@ def handle_incoming_message(parsed: dict):
     text = parsed.get("text", "")
     message_id = parsed.get("message_id")
     
-    logger.info(f"Incoming WhatsApp from {from_phone}: {text}")
+    logger.info("Incoming WhatsApp from %s: %s", from_phone, text)
     
-    # Find associated lead by phone number (last 10 digits)
-    phone_suffix = from_phone[-10:] if len(from_phone) >= 10 else from_phone
-    lead = Lead.objects.filter(phone__icontains=phone_suffix).first()
+    # Meta redelivers webhooks it didn't see acknowledged in time; don't log
+    # the message twice or pay for a second AI reply to it.
+    if message_id and WhatsAppMessage.objects.filter(message_id=message_id, direction="inbound").exists():
+        logger.info("WhatsApp message %s already received - skipping redelivery", message_id)
+        return
+    
+    # Find associated lead by the last 10 digits of the number; Meta sends
+    # "919876543210" while leads may be stored as "09876543210" etc.
+    lead = Lead.objects.by_phone_suffix(from_phone).only("id", "tenant_id").first()
     
     # Log the message
     msg_record = WhatsAppMessage.objects.create(
         lead=lead,
-        tenant=lead.tenant if lead else None,
+        tenant_id=lead.tenant_id if lead else None,
         direction="inbound",
         message_type="text",
         from_phone=from_phone,
@@ -96,34 +106,36 @@ def handle_incoming_message(parsed: dict):
     
     # Only trigger AI reply if we have a known lead
     if lead:
-        logger.info(f"Queuing AI reply handler for WhatsApp message {msg_record.id}")
+        logger.info("Queuing AI reply handler for WhatsApp message %s", msg_record.id)
         from .tasks import handle_incoming_whatsapp_with_ai_task
         handle_incoming_whatsapp_with_ai_task.delay(msg_record.id)
     else:
-        logger.warning(f"No lead found for phone {from_phone} - skipping AI reply")
+        logger.warning("No lead found for phone %s - skipping AI reply", from_phone)
 
 
 def handle_status_update(parsed: dict):
     """Handle WhatsApp message status update (sent, delivered, read)."""
     message_id = parsed.get("message_id")
     new_status = parsed.get("status", "")
+    if not message_id:
+        return
     
-    # Update existing message record
+    # Update the existing message record in a single UPDATE; Meta sends
+    # several of these per outbound message and waits on our response.
+    fields = {"status": new_status, "updated_at": timezone.now()}
+    if parsed.get("errors"):
+        fields["error_message"] = str(parsed["errors"])
+        fields["status"] = "failed"
     try:
-        msg = WhatsAppMessage.objects.filter(message_id=message_id).first()
-        if msg:
-            msg.status = new_status
-            if parsed.get("errors"):
-                msg.error_message = str(parsed["errors"])
-                msg.status = "failed"
-            msg.save(update_fields=["status", "error_message", "updated_at"])
-            logger.info(f"WhatsApp message {message_id} status updated to {new_status}")
+        if WhatsAppMessage.objects.filter(message_id=message_id).update(**fields):
+            logger.info("WhatsApp message %s status updated to %s", message_id, new_status)
     except Exception as e:
-        logger.error(f"Failed to update WhatsApp status: {e}")
+        logger.error("Failed to update WhatsApp status: %s", e)
 
 
 @api_view(["POST"])
 @permission_classes([IsAuthenticated])
+@throttle_classes([WhatsAppSendThrottle])
 def send_whatsapp_message(request):
     """
     Send WhatsApp message to a lead.
@@ -142,9 +154,9 @@ def send_whatsapp_message(request):
     if not lead_id:
         return Response({"error": "lead_id is required"}, status=400)
     
-    # Get target lead
+    # Get target lead (only what the send and the log row need)
     try:
-        target = Lead.objects.get(id=lead_id)
+        target = Lead.objects.only("id", "phone", "name", "tenant_id").get(id=lead_id)
         phone = target.phone
         name = target.name
     except Lead.DoesNotExist:
@@ -172,7 +184,7 @@ def send_whatsapp_message(request):
     # Log the message
     msg_record = WhatsAppMessage.objects.create(
         lead=target,
-        tenant=getattr(target, 'tenant', None),
+        tenant_id=target.tenant_id,
         direction="outbound",
         message_type="template" if template_name else "text",
         template_name=template_name,
@@ -200,6 +212,7 @@ def send_whatsapp_message(request):
 
 @api_view(["POST"])
 @permission_classes([IsAuthenticated])
+@throttle_classes([WhatsAppSendThrottle])
 def send_document_upload_request(request):
     """
     Send document upload request via WhatsApp.
@@ -213,7 +226,7 @@ def send_document_upload_request(request):
         return Response({"error": "lead_id is required"}, status=400)
     
     try:
-        target = Lead.objects.get(id=lead_id)
+        target = Lead.objects.only("id", "phone", "name", "tenant_id").get(id=lead_id)
     except Lead.DoesNotExist:
         return Response({"error": "Lead not found"}, status=404)
     
@@ -223,18 +236,17 @@ def send_document_upload_request(request):
     if not phone:
         return Response({"error": "No phone number"}, status=400)
     
-    # Generate upload link
-    from .views import generate_upload_token
-    token = generate_upload_token(target.id if isinstance(target, Lead) else None, target.tenant_id if hasattr(target, 'tenant_id') else None)
-    upload_link = f"{settings.FRONTEND_URL}/upload?token={token}"
+    # Generate upload link (same signed token as GenerateUploadLinkView)
+    from .views_public import signer as upload_token_signer
+    token = upload_token_signer.sign(str(target.id))
+    upload_link = f"{settings.FRONTEND_URL.rstrip('/')}/upload?token={token}"
     
     result = send_document_request(phone, name, upload_link)
     
     # Log
     WhatsAppMessage.objects.create(
-        lead=target if isinstance(target, Lead) else None,
-        applicant=target if isinstance(target, Applicant) else None,
-        tenant=getattr(target, 'tenant', None),
+        lead=target,
+        tenant_id=target.tenant_id,
         direction="outbound",
         message_type="template",
         template_name="document_upload_request",